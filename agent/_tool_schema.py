@@ -0,0 +1,376 @@
+import hashlib
+
+import google.generativeai as genai
+
+# Built once at import time and shared by every agent instance.
+TOOLS = [
+    genai.protos.Tool(
+        function_declarations=[
+            # file func declaration
+            genai.protos.FunctionDeclaration(
+                name="check_trash_bin",
+                description="Check Trash/Recycle Bin for files older than specified days",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "days_threshold": genai.protos.Schema(
+                            type=genai.protos.Type.INTEGER,
+                            description="Only show files older than this many days (default: 10)",
+                        )
+                    },
+                ),
+            ),
+            genai.protos.FunctionDeclaration(
+                name="clean_old_trash_files",
+                description="Delete files from trash older than specified days",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "days_threshold": genai.protos.Schema(
+                            type=genai.protos.Type.INTEGER,
+                            description="Delete files older than this many days",
+                        ),
+                        "confirm": genai.protos.Schema(
+                            type=genai.protos.Type.BOOLEAN,
+                            description="Whether to ask for confirmation (default: true)",
+                        ),
+                    },
+                    required=["days_threshold"],
+                ),
+            ),
+            genai.protos.FunctionDeclaration(
+                name="read_file_content",
+                description="Read and analyze the content of a file",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "file_path": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="Path to the file to read (supports ~ for home directory)",
+                        ),
+                        "max_lines": genai.protos.Schema(
+                            type=genai.protos.Type.INTEGER,
+                            description="Maximum number of lines to read (default: 500)",
+                        ),
+                    },
+                    required=["file_path"],
+                ),
+            ),
+            genai.protos.FunctionDeclaration(
+                name="write_file_content",
+                description="Write content to a file with optional backup",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "file_path": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="Path where to write the file",
+                        ),
+                        "content": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="Content to write to the file",
+                        ),
+                        "backup": genai.protos.Schema(
+                            type=genai.protos.Type.BOOLEAN,
+                            description="Create backup of existing file (default: true)",
+                        ),
+                    },
+                    required=["file_path", "content"],
+                ),
+            ),
+            genai.protos.FunctionDeclaration(
+                name="list_directory_contents",
+                description="List files and directories in a given path",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "dir_path": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="Directory path to list (default: current directory)",
+                        ),
+                        "show_hidden": genai.protos.Schema(
+                            type=genai.protos.Type.BOOLEAN,
+                            description="Show hidden files starting with . (default: false)",
+                        ),
+                    },
+                ),
+            ),
+            genai.protos.FunctionDeclaration(
+                name="find_files",
+                description="Find files matching a glob pattern recursively.",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "pattern": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="The glob pattern to match (e.g., '**/*.py')",
+                        ),
+                        "base_path": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="The base path to search from (default: current directory)",
+                        ),
+                    },
+                    required=["pattern"],
+                ),
+            ),
+            genai.protos.FunctionDeclaration(
+                name="search_text",
+                description="Search for a text pattern in files matching a glob pattern.",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "pattern": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="The text pattern to search for (can be a regex).",
+                        ),
+                        "file_pattern": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="The glob pattern for files to search (e.g., '**/*.py').",
+                        ),
+                        "base_path": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="The base path to search from (default: current directory).",
+                        ),
+                    },
+                    required=["pattern", "file_pattern"],
+                ),
+            ),
+            # sqldb Tools
+            genai.protos.FunctionDeclaration(
+                name="create_mysql_database",
+                description="Create a new MySQL database with metadata tracking",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "database_name": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="Name of the MySQL database to create",
+                        ),
+                        "description": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="Description of the database purpose",
+                        ),
+                    },
+                    required=["database_name"],
+                ),
+            ),
+            genai.protos.FunctionDeclaration(
+                name="execute_mysql_command",
+                description="Execute SQL commands on MySQL database and save to .sql file",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "database_name": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="Name of the MySQL database",
+                        ),
+                        "sql_command": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="SQL command(s) to execute",
+                        ),
+                        "save_to_file": genai.protos.Schema(
+                            type=genai.protos.Type.BOOLEAN,
+                            description="Whether to save commands to .sql file (default: true)",
+                        ),
+                        "max_rows": genai.protos.Schema(
+                            type=genai.protos.Type.INTEGER,
+                            description="Maximum number of rows returned per SELECT, 0 for no limit (default: 10000)",
+                        ),
+                    },
+                    required=["database_name", "sql_command"],
+                ),
+            ),
+            genai.protos.FunctionDeclaration(
+                name="analyze_mysql_database_structure",
+                description="Analyze MySQL database structure and provide educational insights about normalization",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "database_name": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="Name of the MySQL database to analyze",
+                        )
+                    },
+                    required=["database_name"],
+                ),
+            ),
+            genai.protos.FunctionDeclaration(
+                name="list_mysql_databases",
+                description="List all MySQL databases with metadata",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT, properties={}
+                ),
+            ),
+            # System Tools
+            genai.protos.FunctionDeclaration(
+                name="get_system_info",
+                description="Get current system information including platform, resources, and user details",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT, properties={}
+                ),
+            ),
+            genai.protos.FunctionDeclaration(
+                name="run_python_script",
+                description="Execute a Python script and capture output and errors",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "script_path": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="Path to the Python script to execute",
+                        ),
+                        "timeout": genai.protos.Schema(
+                            type=genai.protos.Type.INTEGER,
+                            description="Maximum execution time in seconds (default: 30)",
+                        ),
+                    },
+                    required=["script_path"],
+                ),
+            ),
+            genai.protos.FunctionDeclaration(
+                name="analyze_python_code",
+                description="Analyze Python code for syntax errors, issues, and suggestions",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "file_path": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="Path to the Python file to analyze",
+                        )
+                    },
+                    required=["file_path"],
+                ),
+            ),
+            genai.protos.FunctionDeclaration(
+                name="send_system_notification",
+                description="Send a system notification (macOS)",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "message": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="Notification message content",
+                        ),
+                        "title": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="Notification title (default: 'System Agent')",
+                        ),
+                    },
+                    required=["message"],
+                ),
+            ),
+            genai.protos.FunctionDeclaration(
+                name="execute_cli_command",
+                description="Execute CLI command with proper shell handling",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "command": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="The command to execute",
+                        ),
+                        "timeout": genai.protos.Schema(
+                            type=genai.protos.Type.INTEGER,
+                            description="Maximum execution time in seconds (default: 30)",
+                        ),
+                    },
+                    required=["command"],
+                ),
+            ),
+            # Web Functions
+            genai.protos.FunctionDeclaration(
+                name="fetch_url_content",
+                description="Fetches and returns the text content of a given URL.",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "url": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="The URL to fetch content from.",
+                        )
+                    },
+                    required=["url"],
+                ),
+            ),
+            genai.protos.FunctionDeclaration(
+                name="fetch_urls_content",
+                description="Fetches several URLs concurrently and returns their text content, in the same order.",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "urls": genai.protos.Schema(
+                            type=genai.protos.Type.ARRAY,
+                            items=genai.protos.Schema(type=genai.protos.Type.STRING),
+                            description="The URLs to fetch content from.",
+                        )
+                    },
+                    required=["urls"],
+                ),
+            ),
+            # Memory Tool
+            genai.protos.FunctionDeclaration(
+                name="remember_fact",
+                description="Saves a fact to the agent's long-term memory.",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "fact": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="The fact to be remembered.",
+                        )
+                    },
+                    required=["fact"],
+                ),
+            ),
+            genai.protos.FunctionDeclaration(
+                name="forget",
+                description="Searches for and optionally removes semantically similar memories from the agent's long-term memory.",
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "fact": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="The fact to forget; similar memories will be searched based on this input.",
+                        ),
+                        "confirm": genai.protos.Schema(
+                            type=genai.protos.Type.BOOLEAN,
+                            description="If true, confirms and deletes matched memories. If false, just previews matches.",
+                        ),
+                        "similarity_threshold": genai.protos.Schema(
+                            type=genai.protos.Type.NUMBER,
+                            description="Optional similarity threshold (0.0 - 1.0) for matching memories (default: 0.85).",
+                        ),
+                        "top_n": genai.protos.Schema(
+                            type=genai.protos.Type.INTEGER,
+                            description="Optional number of top similar memories to consider for deletion (default: 3).",
+                        ),
+                    },
+                    required=["fact"],
+                ),
+            ),
+            # Chained tool calls
+            genai.protos.FunctionDeclaration(
+                name="run_tool_program",
+                description=(
+                    "Run a short Python snippet that calls other tools directly (keyword arguments only) "
+                    "and returns a value, e.g. to read every file found by find_files in one step. "
+                    "Only tool calls, basic builtins, loops, ifs and dict/list/str methods are allowed."
+                ),
+                parameters=genai.protos.Schema(
+                    type=genai.protos.Type.OBJECT,
+                    properties={
+                        "code": genai.protos.Schema(
+                            type=genai.protos.Type.STRING,
+                            description="Python statements; use `return` to hand the final result back.",
+                        )
+                    },
+                    required=["code"],
+                ),
+            ),
+        ]
+    )
+]
+
+TOOLS_DIGEST = hashlib.sha256(
+    b"".join(genai.protos.Tool.serialize(tool) for tool in TOOLS)
+).hexdigest()
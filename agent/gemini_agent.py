@@ -1,421 +1,652 @@
+import asyncio
+import functools
+import importlib
+import inspect
+import itertools
+import json
+import textwrap
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+
 import google.generativeai as genai
+import httpx
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from config.settings import config
-from tools import file_system, mysql_tools, system, web_fetcher
-from tools.memory_manager import MemoryManager
+from agent._tool_schema import TOOLS, TOOLS_DIGEST
+from agent.history import History
+from agent.llm_cache import DiskBackend, LLMCache, MemoryBackend
+from agent.tool_program import run_tool_program
+
+# Tools with side effects (or that prompt for input) are never run concurrently.
+SEQUENTIAL_TOOLS = frozenset(
+    {
+        "clean_old_trash_files",
+        "write_file_content",
+        "create_mysql_database",
+        "execute_mysql_command",
+        "analyze_mysql_database_structure",
+        "list_mysql_databases",
+        "run_python_script",
+        "send_system_notification",
+        "execute_cli_command",
+        "remember_fact",
+        "forget",
+        "run_tool_program",
+    }
+)
+
+# Read-only tools whose results can be reused for a short while, with their TTL in seconds
+IDEMPOTENT_TOOLS = {
+    "read_file_content": 60,
+    "list_directory_contents": 60,
+    "find_files": 60,
+    "search_text": 60,
+    "list_mysql_databases": 60,
+    "analyze_mysql_database_structure": 60,
+    "get_system_info": 60,
+    "analyze_python_code": 60,
+    "check_trash_bin": 60,
+    "fetch_url_content": 300,
+    "fetch_urls_content": 300,
+}
+TOOL_CACHE_SIZE = 256
+
+# Adjacent calls to these tools run in one process: tool -> (batch function, argument it batches)
+BATCHABLE_TOOLS = {
+    "execute_cli_command": ("execute_cli_commands", "command"),
+    "run_python_script": ("run_python_scripts", "script_path"),
+}
+
+# Keeps the tool declarations but stops the model from calling them
+NO_TOOL_CALLS = {"function_calling_config": {"mode": "none"}}
+HTTP_HEADERS = {"User-Agent": "AICOOK/1"}
+QUIT_COMMANDS = frozenset({"quit", "exit", "bye"})
+MARKDOWN_CACHE_SIZE = 64
+MARKDOWN_CACHE_MAX_CHARS = 4096
+REPEATING_CALLS_NOTE = (
+    "The previous tool call is repeating; produce a final answer without tools."
+)
+
+# Tool modules are only imported when one of their tools is first called.
+LAZY_MODULES = {
+    "file_system": "tools.file_system",
+    "mysql_tools": "tools.mysql_tools",
+    "system": "tools.system",
+    "web_fetcher": "tools.web_fetcher",
+}
+
+# tool name -> (module, function), resolved on first use
+TOOL_FUNCTIONS = {
+    # File System Tools
+    "check_trash_bin": ("file_system", "check_trash_bin"),
+    "clean_old_trash_files": ("file_system", "clean_old_trash_files"),
+    "read_file_content": ("file_system", "read_file_content"),
+    "write_file_content": ("file_system", "write_file_content"),
+    "list_directory_contents": ("file_system", "list_directory_contents"),
+    "find_files": ("file_system", "find_files"),
+    "search_text": ("file_system", "search_text"),
+    # mysql db Tools
+    "create_mysql_database": ("mysql_tools", "create_mysql_database"),
+    "execute_mysql_command": ("mysql_tools", "execute_mysql_command"),
+    "analyze_mysql_database_structure": ("mysql_tools", "analyze_mysql_database_structure"),
+    "list_mysql_databases": ("mysql_tools", "list_mysql_databases"),
+    # System Tools
+    "get_system_info": ("system", "get_system_info"),
+    "run_python_script": ("system", "run_python_script"),
+    "analyze_python_code": ("system", "analyze_python_code"),
+    "send_system_notification": ("system", "send_system_notification"),
+    "execute_cli_command": ("system", "execute_cli_command"),
+}
+
+
+def load_tool_module(name):
+    return importlib.import_module(LAZY_MODULES[name])
+
+
+_CONFIGURED = False
+
+
+@functools.lru_cache(maxsize=4)
+def _get_model(name):
+    """One GenerativeModel per model name, shared by every agent and worker in the process."""
+    global _CONFIGURED
+    if not _CONFIGURED:
+        genai.configure(api_key=config.GEMINI_API_KEY)
+        _CONFIGURED = True
+    return genai.GenerativeModel(
+        name,
+        generation_config=genai.GenerationConfig(temperature=config.TEMPERATURE),
+    )
+
+
+def memory_disabled(**kwargs):
+    return {"error": "memory disabled (set ENABLE_MEMORY=true to turn it on)"}
+
+
+def bootstrap_history():
+    """Opening turns every conversation starts with."""
+    return [
+        {
+            "role": "user",
+            "parts": [
+                "You are an AI assistant with memory capabilities. "
+                "When a task needs several dependent tool calls (e.g. find files, then read each one), "
+                "prefer a single run_tool_program call that chains them instead of calling tools one by one."
+            ],
+        },
+        {
+            "role": "model",
+            "parts": [
+                "I am AICOOK, your personal AI assistant. I can learn from our interactions. How can I help you today?"
+            ],
+        },
+    ]
+
+
+def function_response_turn(name, result):
+    """History entry carrying a tool result back to the model."""
+    return {
+        "role": "function",
+        "parts": [
+            genai.protos.Part(
+                function_response=genai.protos.FunctionResponse(
+                    name=name,
+                    response={"result": result},
+                )
+            )
+        ],
+    }
+
+
+def pb_to_py(value):
+    """Converts the proto-plus map/list wrappers in function_call.args into plain Python values."""
+    if isinstance(value, (str, bool, int)):
+        return value
+    if isinstance(value, float):
+        # Struct values are always doubles, tools expect ints for counts and limits
+        return int(value) if value.is_integer() else value
+    if hasattr(value, "items"):
+        return {k: pb_to_py(v) for k, v in value.items()}
+    if hasattr(value, "__iter__"):
+        return [pb_to_py(v) for v in value]
+    return value
+
+
+def part_text(part):
+    """Plain-text rendering of a history part, used for sizing and summaries."""
+    if isinstance(part, str):
+        return part
+    if getattr(part, "function_call", None):
+        return f"[called {part.function_call.name}({dict(part.function_call.args)})]"
+    if getattr(part, "function_response", None):
+        return f"[{part.function_response.name} returned {dict(part.function_response.response)}]"
+    return getattr(part, "text", "") or str(part)
 
 
 class GeminiAgent:
     def __init__(self):
         self.console = Console()
         self.model = self._setup_model()
-        self.history = []
-        self.memory = MemoryManager()
-        self.tools = self._setup_tools()
+        self.history = History(maxlen=config.MAX_HISTORY)
+        self.memory = self._setup_memory()
+        self._recall_cached = functools.lru_cache(maxsize=128)(
+            self.memory.recall if self.memory else lambda query: []
+        )
+        self.tools = TOOLS
         self.function_map = self._setup_function_map()
+        self.tool_params = {}
+        self._resolved_tools = {}
+        self.async_function_map = self._setup_async_function_map()
+        self.http = self._setup_http()
+        self.session = None
+        self._last_memory_context = None
+        self._tool_cache = OrderedDict()
+        self._md_cache = OrderedDict()
+        self.cache = self._setup_cache()
 
     def _setup_model(self):
-        genai.configure(api_key=config.GEMINI_API_KEY)
-        return genai.GenerativeModel(config.MODEL_NAME)
-
-    def _setup_tools(self):
-        return [
-            genai.protos.Tool(
-                function_declarations=[
-                    # file func declaration
-                    genai.protos.FunctionDeclaration(
-                        name="check_trash_bin",
-                        description="Check Trash/Recycle Bin for files older than specified days",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "days_threshold": genai.protos.Schema(
-                                    type=genai.protos.Type.INTEGER,
-                                    description="Only show files older than this many days (default: 10)",
-                                )
-                            },
-                        ),
-                    ),
-                    genai.protos.FunctionDeclaration(
-                        name="clean_old_trash_files",
-                        description="Delete files from trash older than specified days",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "days_threshold": genai.protos.Schema(
-                                    type=genai.protos.Type.INTEGER,
-                                    description="Delete files older than this many days",
-                                ),
-                                "confirm": genai.protos.Schema(
-                                    type=genai.protos.Type.BOOLEAN,
-                                    description="Whether to ask for confirmation (default: true)",
-                                ),
-                            },
-                            required=["days_threshold"],
-                        ),
-                    ),
-                    genai.protos.FunctionDeclaration(
-                        name="read_file_content",
-                        description="Read and analyze the content of a file",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "file_path": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="Path to the file to read (supports ~ for home directory)",
-                                ),
-                                "max_lines": genai.protos.Schema(
-                                    type=genai.protos.Type.INTEGER,
-                                    description="Maximum number of lines to read (default: 500)",
-                                ),
-                            },
-                            required=["file_path"],
-                        ),
-                    ),
-                    genai.protos.FunctionDeclaration(
-                        name="write_file_content",
-                        description="Write content to a file with optional backup",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "file_path": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="Path where to write the file",
-                                ),
-                                "content": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="Content to write to the file",
-                                ),
-                                "backup": genai.protos.Schema(
-                                    type=genai.protos.Type.BOOLEAN,
-                                    description="Create backup of existing file (default: true)",
-                                ),
-                            },
-                            required=["file_path", "content"],
-                        ),
-                    ),
-                    genai.protos.FunctionDeclaration(
-                        name="list_directory_contents",
-                        description="List files and directories in a given path",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "dir_path": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="Directory path to list (default: current directory)",
-                                ),
-                                "show_hidden": genai.protos.Schema(
-                                    type=genai.protos.Type.BOOLEAN,
-                                    description="Show hidden files starting with . (default: false)",
-                                ),
-                            },
-                        ),
-                    ),
-                    genai.protos.FunctionDeclaration(
-                        name="find_files",
-                        description="Find files matching a glob pattern recursively.",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "pattern": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="The glob pattern to match (e.g., '**/*.py')",
-                                ),
-                                "base_path": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="The base path to search from (default: current directory)",
-                                ),
-                            },
-                            required=["pattern"],
-                        ),
-                    ),
-                    genai.protos.FunctionDeclaration(
-                        name="search_text",
-                        description="Search for a text pattern in files matching a glob pattern.",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "pattern": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="The text pattern to search for (can be a regex).",
-                                ),
-                                "file_pattern": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="The glob pattern for files to search (e.g., '**/*.py').",
-                                ),
-                                "base_path": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="The base path to search from (default: current directory).",
-                                ),
-                            },
-                            required=["pattern", "file_pattern"],
-                        ),
-                    ),
-                    # sqldb Tools
-                    genai.protos.FunctionDeclaration(
-                        name="create_mysql_database",
-                        description="Create a new MySQL database with metadata tracking",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "database_name": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="Name of the MySQL database to create",
-                                ),
-                                "description": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="Description of the database purpose",
-                                ),
-                            },
-                            required=["database_name"],
-                        ),
-                    ),
-                    genai.protos.FunctionDeclaration(
-                        name="execute_mysql_command",
-                        description="Execute SQL commands on MySQL database and save to .sql file",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "database_name": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="Name of the MySQL database",
-                                ),
-                                "sql_command": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="SQL command(s) to execute",
-                                ),
-                                "save_to_file": genai.protos.Schema(
-                                    type=genai.protos.Type.BOOLEAN,
-                                    description="Whether to save commands to .sql file (default: true)",
-                                ),
-                            },
-                            required=["database_name", "sql_command"],
-                        ),
-                    ),
-                    genai.protos.FunctionDeclaration(
-                        name="analyze_mysql_database_structure",
-                        description="Analyze MySQL database structure and provide educational insights about normalization",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "database_name": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="Name of the MySQL database to analyze",
-                                )
-                            },
-                            required=["database_name"],
-                        ),
-                    ),
-                    genai.protos.FunctionDeclaration(
-                        name="list_mysql_databases",
-                        description="List all MySQL databases with metadata",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT, properties={}
-                        ),
-                    ),
-                    # System Tools
-                    genai.protos.FunctionDeclaration(
-                        name="get_system_info",
-                        description="Get current system information including platform, resources, and user details",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT, properties={}
-                        ),
-                    ),
-                    genai.protos.FunctionDeclaration(
-                        name="run_python_script",
-                        description="Execute a Python script and capture output and errors",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "script_path": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="Path to the Python script to execute",
-                                ),
-                                "timeout": genai.protos.Schema(
-                                    type=genai.protos.Type.INTEGER,
-                                    description="Maximum execution time in seconds (default: 30)",
-                                ),
-                            },
-                            required=["script_path"],
-                        ),
-                    ),
-                    genai.protos.FunctionDeclaration(
-                        name="analyze_python_code",
-                        description="Analyze Python code for syntax errors, issues, and suggestions",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "file_path": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="Path to the Python file to analyze",
-                                )
-                            },
-                            required=["file_path"],
-                        ),
-                    ),
-                    genai.protos.FunctionDeclaration(
-                        name="send_system_notification",
-                        description="Send a system notification (macOS)",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "message": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="Notification message content",
-                                ),
-                                "title": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="Notification title (default: 'System Agent')",
-                                ),
-                            },
-                            required=["message"],
-                        ),
-                    ),
-                    genai.protos.FunctionDeclaration(
-                        name="execute_cli_command",
-                        description="Execute CLI command with proper shell handling",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "command": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="The command to execute",
-                                ),
-                                "timeout": genai.protos.Schema(
-                                    type=genai.protos.Type.INTEGER,
-                                    description="Maximum execution time in seconds (default: 30)",
-                                ),
-                            },
-                            required=["command"],
-                        ),
-                    ),
-                    # Web Functions
-                    genai.protos.FunctionDeclaration(
-                        name="fetch_url_content",
-                        description="Fetches and returns the text content of a given URL.",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "url": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="The URL to fetch content from.",
-                                )
-                            },
-                            required=["url"],
-                        ),
-                    ),
-                    # Memory Tool
-                    genai.protos.FunctionDeclaration(
-                        name="remember_fact",
-                        description="Saves a fact to the agent's long-term memory.",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "fact": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="The fact to be remembered.",
-                                )
-                            },
-                            required=["fact"],
-                        ),
-                    ),
-                    genai.protos.FunctionDeclaration(
-                        name="forget",
-                        description="Searches for and optionally removes semantically similar memories from the agent's long-term memory.",
-                        parameters=genai.protos.Schema(
-                            type=genai.protos.Type.OBJECT,
-                            properties={
-                                "fact": genai.protos.Schema(
-                                    type=genai.protos.Type.STRING,
-                                    description="The fact to forget; similar memories will be searched based on this input.",
-                                ),
-                                "confirm": genai.protos.Schema(
-                                    type=genai.protos.Type.BOOLEAN,
-                                    description="If true, confirms and deletes matched memories. If false, just previews matches.",
-                                ),
-                                "similarity_threshold": genai.protos.Schema(
-                                    type=genai.protos.Type.NUMBER,
-                                    description="Optional similarity threshold (0.0 - 1.0) for matching memories (default: 0.85).",
-                                ),
-                                "top_n": genai.protos.Schema(
-                                    type=genai.protos.Type.INTEGER,
-                                    description="Optional number of top similar memories to consider for deletion (default: 3).",
-                                ),
-                            },
-                            required=["fact"],
-                        ),
-                    ),
-                ]
-            )
-        ]
+        return _get_model(config.MODEL_NAME)
+
+    def _setup_cache(self):
+        if config.LLM_CACHE_PATH:
+            return LLMCache(DiskBackend(config.LLM_CACHE_PATH))
+        return LLMCache(MemoryBackend(1024))
+
+    def _setup_http(self):
+        # one keep-alive pool for every fetch in this session, with web_fetcher's retries and encodings
+        http = load_tool_module("web_fetcher")._make_session()
+        http.headers.update(HTTP_HEADERS)
+        return http
+
+    def new_async_client(self):
+        return httpx.AsyncClient(timeout=10, follow_redirects=True, headers=HTTP_HEADERS)
+
+    def _setup_memory(self):
+        if not config.ENABLE_MEMORY:
+            return None
+        # chromadb + sentence-transformers take seconds to import
+        from tools.memory_manager import MemoryManager
+
+        return MemoryManager()
+
+    def recall_memories(self, user_input):
+        """
+        Memories relevant to the input, skipping the embedding + vector lookup for
+        short or command-like inputs and reusing results for repeated inputs.
+        """
+        if self.memory is None:
+            return []
+        query = user_input.strip().lower()
+        if len(query.split()) < config.MEMORY_MIN_TOKENS or query.startswith(("/", "!")):
+            return []
+        return self._recall_cached(query)
 
     def _setup_function_map(self):
+        # only the memory tools are bound to this instance
+        return MappingProxyType(
+            {
+                **TOOL_FUNCTIONS,
+                # Memory Tool
+                "remember_fact": self.memory.remember if self.memory else memory_disabled,
+                "forget": self.memory.forget if self.memory else memory_disabled,
+                # Web Tool
+                "fetch_url_content": self.fetch_url_content,
+                "fetch_urls_content": self.fetch_urls_content,
+                # Chained tool calls
+                "run_tool_program": self.run_tool_program,
+            }
+        )
+
+    def resolve_tool(self, name):
+        """Returns the callable for a tool, importing its module on first use."""
+        fn = self._resolved_tools.get(name)
+        if fn is None:
+            target = self.function_map.get(name)
+            if target is None:
+                return None
+            if isinstance(target, tuple):
+                module, attr = target
+                target = getattr(load_tool_module(module), attr)
+            fn = self._resolved_tools[name] = target
+        return fn
+
+    def accepted_params(self, name, fn):
+        """Parameter names a tool accepts, None when it takes **kwargs."""
+        if name not in self.tool_params:
+            params = inspect.signature(fn).parameters.values()
+            if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params):
+                self.tool_params[name] = None
+            else:
+                self.tool_params[name] = frozenset(p.name for p in params)
+        return self.tool_params[name]
+
+    def accepted_args(self, name, fn, function_args):
+        """Drops arguments the tool doesn't take instead of failing the whole call."""
+        accepted = self.accepted_params(name, fn)
+        if accepted is None:
+            return function_args
+        return {k: v for k, v in function_args.items() if k in accepted}
+
+    def call_tool_sync(self, function_name, function_args):
+        """
+        _call_tool for callers already on a worker thread (tool programs):
+        same argument filtering and error results, and memory changes invalidate recall.
+        """
+        if function_name not in self.function_map:
+            return {"error": f"Unknown function: {function_name}"}
+        try:
+            fn = self.resolve_tool(function_name)
+            return fn(**self.accepted_args(function_name, fn, function_args))
+        except Exception as e:
+            return {"error": f"Function execution error: {str(e)}"}
+        finally:
+            if function_name in ("remember_fact", "forget"):
+                self._recall_cached.cache_clear()
+
+    def fetch_url_content(self, url):
+        return load_tool_module("web_fetcher").fetch_url_content(url, session=self.http)
+
+    def fetch_urls_content(self, urls):
+        return load_tool_module("web_fetcher").fetch_urls_content(urls)
+
+    def run_tool_program(self, code):
+        def proxy(name):
+            return lambda **kwargs: self.call_tool_sync(name, kwargs)
+
+        tools = {
+            name: proxy(name) for name in self.function_map if name != "run_tool_program"
+        }
+        return run_tool_program(code, tools)
+
+    def _setup_async_function_map(self):
+        # Native coroutine versions of I/O bound tools, everything else runs in a thread
         return {
-            # File System Tools
-            "check_trash_bin": file_system.check_trash_bin,
-            "clean_old_trash_files": file_system.clean_old_trash_files,
-            "read_file_content": file_system.read_file_content,
-            "write_file_content": file_system.write_file_content,
-            "list_directory_contents": file_system.list_directory_contents,
-            "find_files": file_system.find_files,
-            "search_text": file_system.search_text,
-            # mysql db Tools
-            "create_mysql_database": mysql_tools.create_mysql_database,
-            "execute_mysql_command": mysql_tools.execute_mysql_command,
-            "analyze_mysql_database_structure": mysql_tools.analyze_mysql_database_structure,
-            "list_mysql_databases": mysql_tools.list_mysql_databases,
-            # System Tools
-            "get_system_info": system.get_system_info,
-            "run_python_script": system.run_python_script,
-            "analyze_python_code": system.analyze_python_code,
-            "send_system_notification": system.send_system_notification,
-            "execute_cli_command": system.execute_cli_command,
-            # Web Tool
-            "fetch_url_content": web_fetcher.fetch_url_content,
-            # Memory Tool
-            "remember_fact": self.memory.remember,
-            "forget": self.memory.forget,
+            "fetch_url_content": lambda url: load_tool_module(
+                "web_fetcher"
+            ).fetch_url_content_async(url, client=self.session),
+            "fetch_urls_content": lambda urls: load_tool_module(
+                "web_fetcher"
+            ).fetch_urls_content_async(urls, client=self.session),
         }
 
-    def execute_function_call(self, function_call):
+    async def execute_function_call(self, function_call):
         function_name = function_call.name
-        function_args = dict(function_call.args)
+        function_args = {k: pb_to_py(v) for k, v in function_call.args.items()}
 
         self.console.print(f"[bold]System Agent executing: {function_name}[/bold]")
-        self.console.print(f"[dim]Parameters: {function_args}[/dim]")
+        self.console.print(
+            f"[dim]Parameters: {textwrap.shorten(repr(function_args), 200)}[/dim]"
+        )
 
-        if function_name in self.function_map:
-            try:
-                result = self.function_map[function_name](**function_args)
-                return result
-            except Exception as e:
-                return {"error": f"Function execution error: {str(e)}"}
-        else:
+        ttl = IDEMPOTENT_TOOLS.get(function_name)
+        if ttl is None:
+            # anything with side effects may invalidate earlier reads
+            self._tool_cache.clear()
+            if function_name in ("remember_fact", "forget"):
+                self._recall_cached.cache_clear()
+            return await self._call_tool(function_name, function_args)
+
+        key = (function_name, json.dumps(function_args, sort_keys=True, default=str))
+        cached = self._tool_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            self._tool_cache.move_to_end(key)
+            self.console.print("[dim]cache hit[/dim]")
+            return cached[1]
+
+        result = await self._call_tool(function_name, function_args)
+        if not (isinstance(result, dict) and "error" in result):
+            self._tool_cache[key] = (time.monotonic(), result)
+            self._tool_cache.move_to_end(key)
+            while len(self._tool_cache) > TOOL_CACHE_SIZE:
+                self._tool_cache.popitem(last=False)
+        return result
+
+    async def _call_tool(self, function_name, function_args):
+        if function_name not in self.function_map:
             return {"error": f"Unknown function: {function_name}"}
 
-    def run(self):
-        self.console.print("[bold cyan]AICOOK - Your Personal AI Assistant[/bold cyan]")
-        self.history.append(
-            {
-                "role": "user",
-                "parts": ["You are an AI assistant with memory capabilities."],
-            }
+        try:
+            fn = self.resolve_tool(function_name)
+            function_args = self.accepted_args(function_name, fn, function_args)
+
+            async_fn = self.async_function_map.get(function_name)
+            if async_fn is not None:
+                return await async_fn(**function_args)
+            if not function_args:
+                return await asyncio.to_thread(fn)
+            return await asyncio.to_thread(fn, **function_args)
+        except Exception as e:
+            return {"error": f"Function execution error: {str(e)}"}
+
+    async def execute_function_calls(self, function_calls):
+        """
+        Execute the function calls of one model response, results in emission order.
+        Independent read-only calls run concurrently.
+        """
+        if len(function_calls) < 2 or any(
+            fc.name in SEQUENTIAL_TOOLS for fc in function_calls
+        ):
+            results = []
+            for function_name, calls in itertools.groupby(function_calls, key=lambda fc: fc.name):
+                calls = list(calls)
+                if function_name in BATCHABLE_TOOLS and len(calls) > 1:
+                    results.extend(await self.execute_batched_calls(function_name, calls))
+                else:
+                    results.extend([await self.execute_function_call(fc) for fc in calls])
+            return results
+
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(self.execute_function_call(fc))
+                for fc in function_calls
+            ]
+        return [task.result() for task in tasks]
+
+    async def execute_batched_calls(self, function_name, function_calls):
+        """
+        Runs adjacent calls to one subprocess tool in a single process,
+        one result per call in the same order.
+        """
+        batch_name, batched_arg = BATCHABLE_TOOLS[function_name]
+        all_args = [{k: pb_to_py(v) for k, v in fc.args.items()} for fc in function_calls]
+
+        self.console.print(
+            f"[bold]System Agent executing: {function_name} x{len(function_calls)} (batched)[/bold]"
         )
-        self.history.append(
-            {
-                "role": "model",
-                "parts": [
-                    "I am AICOOK, your personal AI assistant. I can learn from our interactions. How can I help you today?"
-                ],
-            }
+        for function_args in all_args:
+            self.console.print(
+                f"[dim]Parameters: {textwrap.shorten(repr(function_args), 200)}[/dim]"
+            )
+
+        self._tool_cache.clear()
+        try:
+            batch_fn = getattr(load_tool_module("system"), batch_name)
+            timeout = sum(int(args.get("timeout", 30)) for args in all_args)
+            return await asyncio.to_thread(
+                batch_fn, [args.get(batched_arg, "") for args in all_args], timeout
+            )
+        except Exception as e:
+            return [{"error": f"Function execution error: {str(e)}"} for _ in function_calls]
+
+    def render_markdown(self, text):
+        """Markdown renderable for text, reusing the parsed object for repeated short outputs."""
+        if len(text) > MARKDOWN_CACHE_MAX_CHARS:
+            return Markdown(text)
+        md = self._md_cache.get(text)
+        if md is None:
+            md = self._md_cache[text] = Markdown(text)
+            if len(self._md_cache) > MARKDOWN_CACHE_SIZE:
+                self._md_cache.popitem(last=False)
+        else:
+            self._md_cache.move_to_end(text)
+        return md
+
+    async def generate_parts(self, allow_tools=True):
+        """
+        Ask the model for the next response parts given the current history.
+        Text is streamed to the console as it arrives, function calls are returned for dispatch.
+        Deterministic requests (TEMPERATURE == 0) are answered from the cache when possible.
+        """
+        tool_config = None if allow_tools else NO_TOOL_CALLS
+        key = None
+        if config.TEMPERATURE == 0:
+            key = self.cache.key(
+                config.MODEL_NAME,
+                self.history,
+                TOOLS_DIGEST if allow_tools else "",
+                config.TEMPERATURE,
+            )
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.console.print("[dim]cache hit[/dim]")
+                parts = [genai.protos.Part.deserialize(raw) for raw in cached]
+                for part in parts:
+                    if part.text:
+                        self.console.print("\n[bold green] System Agent:[/bold green]")
+                        self.console.print(self.render_markdown(part.text))
+                return parts
+
+        response = await self.model.generate_content_async(
+            self.history.contents(), tools=self.tools, tool_config=tool_config, stream=True
+        )
+        text_buf = ""
+        fc_parts = []
+        live = None
+        try:
+            async for chunk in response:
+                if not chunk.candidates:
+                    continue
+                for part in chunk.candidates[0].content.parts:
+                    if part.function_call:
+                        fc_parts.append(part)
+                    elif part.text:
+                        text_buf += part.text
+                        if live is None:
+                            self.console.print("\n[bold green] System Agent:[/bold green]")
+                            live = Live(
+                                Markdown(text_buf),
+                                console=self.console,
+                                refresh_per_second=12,
+                            )
+                            live.start()
+                        else:
+                            live.update(Markdown(text_buf))
+        finally:
+            if live is not None:
+                live.stop()
+
+        parts = ([genai.protos.Part(text=text_buf)] if text_buf else []) + fc_parts
+        if key is not None:
+            self.cache.set(key, [genai.protos.Part.serialize(part) for part in parts])
+        return parts
+
+    async def compact_history(self):
+        """
+        Keep the prompt a bounded size: once the history exceeds HISTORY_TOKEN_BUDGET,
+        everything between the bootstrap turns and the last KEEP_LAST_TURNS turns is
+        replaced with a model-written summary.
+        """
+        # rough estimate of 4 characters per token
+        size = sum(
+            len(part_text(part)) for turn in self.history for part in turn["parts"]
+        ) // 4
+        if size <= config.HISTORY_TOKEN_BUDGET:
+            return
+
+        # only cut right before a user turn so call/response pairs stay together
+        window = list(self.history.window)
+        cut = len(window) - max(config.KEEP_LAST_TURNS, 1)
+        while cut > 0 and window[cut]["role"] != "user":
+            cut -= 1
+        if cut <= 0:
+            return
+
+        old_turns = window[:cut]
+        transcript = "\n".join(
+            f"{turn['role']}: {part_text(part)}"
+            for turn in old_turns
+            for part in turn["parts"]
         )
+        try:
+            response = await self.model.generate_content_async(
+                [
+                    "Summarize this conversation so far. Keep facts about the user, decisions made, "
+                    "file paths, names and results that may matter later. Be concise.\n\n" + transcript
+                ]
+            )
+            summary = response.text
+        except Exception as e:
+            self.console.print(f"[dim]Could not summarize history: {str(e)}[/dim]")
+            return
+
+        self.history.replace_oldest(
+            cut, {"role": "user", "parts": [f"[Summary] {summary}"]}
+        )
+        self._last_memory_context = None
+
+    def run_batch(self, prompts):
+        """
+        Answer several independent prompts concurrently, each in its own conversation.
+        Returns the final text answers in the same order as `prompts`, or the exception
+        for a prompt that failed so one bad prompt doesn't cost the others their answers.
+        """
+        return asyncio.run(self._run_batch(prompts))
+
+    async def _run_batch(self, prompts):
+        semaphore = asyncio.Semaphore(config.BATCH_CONCURRENCY)
+
+        async def run_one(prompt):
+            async with semaphore:
+                return await self._answer_prompt(prompt)
+
+        async with self.new_async_client() as self.session:
+            return await asyncio.gather(
+                *(run_one(prompt) for prompt in prompts), return_exceptions=True
+            )
+
+    async def _answer_prompt(self, prompt):
+        history = bootstrap_history()
+        history.append({"role": "user", "parts": [prompt]})
+        answer = []
+
+        for _ in range(config.MAX_ITERATIONS):
+            response = await self.model.generate_content_async(history, tools=self.tools)
+            if not response.candidates:
+                # blocked prompts come back without any candidate
+                raise ValueError(f"No response candidates: {response.prompt_feedback}")
+            response_part = list(response.candidates[0].content.parts or [])
+            fc_parts = [
+                part
+                for part in response_part
+                if hasattr(part, "function_call") and part.function_call
+            ]
+            function_results = iter(
+                await self.execute_function_calls(
+                    [part.function_call for part in fc_parts]
+                )
+            )
+
+            for part in response_part:
+                if hasattr(part, "function_call") and part.function_call:
+                    history.append({"role": "model", "parts": [part]})
+                    history.append(
+                        function_response_turn(
+                            part.function_call.name, next(function_results)
+                        )
+                    )
+                elif hasattr(part, "text") and part.text:
+                    answer.append(part.text)
+                    history.append({"role": "model", "parts": [part.text]})
+
+            if not fc_parts:
+                break
+
+        return "\n".join(answer)
+
+    async def ainput(self, prompt):
+        """
+        Read a line from the console without blocking the event loop.
+        Uses a daemon thread so a pending prompt never holds up interpreter exit.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve(setter, value):
+            if not future.done():
+                setter(value)
+
+        def reader():
+            try:
+                value = self.console.input(prompt)
+            except BaseException as e:
+                loop.call_soon_threadsafe(resolve, future.set_exception, e)
+            else:
+                loop.call_soon_threadsafe(resolve, future.set_result, value)
+
+        threading.Thread(target=reader, daemon=True).start()
+        return await future
+
+    def run(self):
+        asyncio.run(self.arun())
+
+    async def arun(self):
+        async with self.new_async_client() as self.session:
+            await self._chat_loop()
+
+    async def _chat_loop(self):
+        self.console.print("[bold cyan]AICOOK - Your Personal AI Assistant[/bold cyan]")
+        self.history.pin(bootstrap_history())
+        max_iterations = config.MAX_ITERATIONS
 
         while True:
             try:
-                user_input = self.console.input("\n[bold blue]You:[/bold blue] ")
+                user_input = await self.ainput("\n[bold blue]You:[/bold blue] ")
 
-                if user_input.lower() in ["quit", "exit", "bye"]:
+                if user_input.lower() in QUIT_COMMANDS:
                     self.console.print(
                         "\n[yellow]AICOOK shutting down safely. Goodbye![/yellow]"
                     )
@@ -425,9 +656,13 @@ class GeminiAgent:
                     continue
 
                 # remember when needed..
-                recalled_memories = self.memory.recall(user_input)
-                if recalled_memories:
-                    memory_context = "\n".join(recalled_memories)
+                recalled_memories = await asyncio.to_thread(
+                    self.recall_memories, user_input
+                )
+                memory_context = "\n".join(recalled_memories)
+                # same memories as last turn are already in the history
+                if recalled_memories and memory_context != self._last_memory_context:
+                    self._last_memory_context = memory_context
                     self.history.append(
                         {
                             "role": "user",
@@ -441,62 +676,75 @@ class GeminiAgent:
                 # Iterate through all the responses until no function calls are left
                 # max_iterations = 10
                 iteration = 0
+                last_calls = last_results = None
+                allow_tools = True
 
-                while iteration < config.MAX_ITERATIONS:
+                while iteration < max_iterations:
                     iteration += 1
 
-                    response = self.model.generate_content(
-                        self.history, tools=self.tools
+                    response_part = await self.generate_parts(allow_tools)
+                    fc_parts = [
+                        part
+                        for part in response_part
+                        if hasattr(part, "function_call") and part.function_call
+                    ]
+                    has_function_calls = bool(fc_parts)
+                    if has_function_calls:
+                        self.console.print(
+                            f"[dim]Operation {iteration}: System function execution...[/dim]"
+                        )
+                    results = await self.execute_function_calls(
+                        [part.function_call for part in fc_parts]
                     )
-                    has_function_calls = False
-                    response_part = response.candidates[0].content.parts
+                    function_results = iter(results)
+
                     if response_part:
                         for part in response_part:
                             if hasattr(part, "function_call") and part.function_call:
-                                has_function_calls = True
-                                self.console.print(
-                                    f"[dim]Operation {iteration}: System function execution...[/dim]"
-                                )
-
-                                function_result = self.execute_function_call(
-                                    part.function_call
-                                )
+                                function_result = next(function_results)
 
                                 self.history.append({"role": "model", "parts": [part]})
                                 self.history.append(
-                                    {
-                                        "role": "function",
-                                        "parts": [
-                                            genai.protos.Part(
-                                                function_response=genai.protos.FunctionResponse(
-                                                    name=part.function_call.name,
-                                                    response={
-                                                        "result": function_result
-                                                    },
-                                                )
-                                            )
-                                        ],
-                                    }
+                                    function_response_turn(
+                                        part.function_call.name, function_result
+                                    )
                                 )
 
                             elif hasattr(part, "text") and part.text:
-                                self.console.print(
-                                    f"\n[bold green] System Agent:[/bold green]"
-                                )
-                                self.console.print(Markdown(part.text))
-                                self.history.append(
-                                    {"role": "model", "parts": [part.text]}
-                                )
+                                # already rendered while streaming, skip exact repeats (retries)
+                                if self.history[-1] != {"role": "model", "parts": [part.text]}:
+                                    self.history.append(
+                                        {"role": "model", "parts": [part.text]}
+                                    )
 
                     if not has_function_calls:
                         break
 
-                if iteration >= config.MAX_ITERATIONS:
+                    # same calls as last time that failed again or changed nothing: it's looping
+                    calls = [
+                        (part.function_call.name, part_text(part)) for part in fc_parts
+                    ]
+                    if calls == last_calls and (
+                        results == last_results
+                        or all(isinstance(r, dict) and "error" in r for r in results)
+                    ):
+                        self.console.print(
+                            "[dim]Tool calls are repeating, asking for a final answer...[/dim]"
+                        )
+                        self.history.append(
+                            {"role": "user", "parts": [REPEATING_CALLS_NOTE]}
+                        )
+                        allow_tools = False
+                    last_calls, last_results = calls, results
+
+                if iteration >= max_iterations:
                     self.console.print(
                         "\n[yellow] System Agent reached operation limit[/yellow]"
                     )
 
-            except KeyboardInterrupt:
+                await self.compact_history()
+
+            except (KeyboardInterrupt, asyncio.CancelledError):
                 self.console.print(
                     "\n[yellow] System Agent interrupted safely. Goodbye![/yellow]"
                 )
@@ -0,0 +1,63 @@
+from collections import deque
+from itertools import islice
+
+from google.generativeai.types import content_types
+
+
+class History:
+    """
+    Conversation turns for the chat loop.
+
+    Pinned turns (the bootstrap) are never evicted, the rest live in a bounded deque.
+    Every turn is converted to a protos.Content once when it's added, so each request
+    reuses the already-built messages instead of re-converting the whole history.
+    """
+
+    def __init__(self, maxlen=None):
+        self.pinned = []
+        self.window = deque(maxlen=maxlen)
+        self._pinned_contents = []
+        self._window_contents = deque(maxlen=maxlen)
+
+    def pin(self, turns):
+        for turn in turns:
+            self.pinned.append(turn)
+            self._pinned_contents.append(content_types.to_content(turn))
+
+    def append(self, turn):
+        # both deques evict their oldest entry together once full
+        self.window.append(turn)
+        self._window_contents.append(content_types.to_content(turn))
+
+    def replace_oldest(self, count, turn):
+        """Drops the `count` oldest unpinned turns and puts `turn` in their place."""
+        for _ in range(count):
+            self.window.popleft()
+            self._window_contents.popleft()
+        self.window.appendleft(turn)
+        self._window_contents.appendleft(content_types.to_content(turn))
+
+    def contents(self):
+        """Request payload, skipping turns orphaned by eviction (a reply without its call)."""
+        skip = 0
+        for turn in self.window:
+            if turn["role"] == "user":
+                break
+            skip += 1
+        return self._pinned_contents + list(islice(self._window_contents, skip, None))
+
+    def __iter__(self):
+        yield from self.pinned
+        yield from self.window
+
+    def __len__(self):
+        return len(self.pinned) + len(self.window)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        if index < len(self.pinned):
+            return self.pinned[index]
+        return self.window[index - len(self.pinned)]
@@ -0,0 +1,149 @@
+import hashlib
+import json
+import sqlite3
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, List, Optional, Tuple
+
+
+class MemoryBackend:
+    """In-process LRU store."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+def _pack_parts(parts: List[bytes]) -> bytes:
+    """Length-prefixed concatenation of the serialized parts."""
+    return b"".join(struct.pack("<I", len(part)) + part for part in parts)
+
+
+def _unpack_parts(blob: bytes) -> List[bytes]:
+    parts = []
+    pos = 0
+    while pos < len(blob):
+        (size,) = struct.unpack_from("<I", blob, pos)
+        pos += 4
+        if pos + size > len(blob):
+            raise struct.error("truncated part")
+        parts.append(blob[pos:pos + size])
+        pos += size
+    return parts
+
+
+class DiskBackend:
+    """
+    SQLite store, survives restarts.
+    Holds (timestamp, list of serialized parts) entries as plain REAL/BLOB columns, nothing is unpickled.
+    """
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            # the old table held pickles, it's dropped rather than ever loaded
+            self._conn.execute("DROP TABLE IF EXISTS llm_cache")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses (key TEXT PRIMARY KEY, stored_at REAL, parts BLOB)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[Tuple[float, List[bytes]]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, parts FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+        if not row:
+            return None
+        try:
+            return row[0], _unpack_parts(row[1])
+        except (struct.error, TypeError):
+            return None  # corrupt entry, treat as a miss
+
+    def set(self, key: str, value: Tuple[float, List[bytes]]) -> None:
+        stored_at, parts = value
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, stored_at, parts) VALUES (?, ?, ?)",
+                (key, float(stored_at), _pack_parts(parts)),
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+            self._conn.commit()
+
+
+def _canonical_part(part: Any) -> Any:
+    """Turns a history part (str, dict or proto message) into plain JSON data."""
+    if isinstance(part, str):
+        return {"text": part}
+    if isinstance(part, dict):
+        return part
+    # proto-plus messages (genai.protos.Part etc.)
+    to_dict = getattr(type(part), "to_dict", None)
+    if to_dict is not None:
+        return to_dict(part)
+    return repr(part)
+
+
+class LLMCache:
+    """
+    Exact-match cache for model responses, keyed by the full request.
+    Entries older than `ttl` seconds are treated as misses.
+    """
+
+    def __init__(self, backend, ttl: float = 3600):
+        self.backend = backend
+        self.ttl = ttl
+
+    def key(self, model_name: str, history: Iterable[dict], tools_digest: str, temperature: float) -> str:
+        canonical = [
+            {
+                "role": turn.get("role"),
+                "parts": [_canonical_part(p) for p in turn.get("parts", [])],
+            }
+            for turn in history
+        ]
+        payload = json.dumps(
+            [model_name, canonical, tools_digest, temperature],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.backend.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.time() - stored_at > self.ttl:
+            self.backend.delete(key)
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self.backend.set(key, (time.time(), value))
@@ -0,0 +1,132 @@
+import ast
+import threading
+from typing import Any, Callable, Dict
+
+MAX_PROGRAM_CHARS = 4000
+PROGRAM_TIMEOUT = 60
+
+# Everything a tool program may use besides the tools themselves
+SAFE_BUILTINS = {
+    "len": len,
+    "range": range,
+    "min": min,
+    "max": max,
+    "sum": sum,
+    "sorted": sorted,
+    "enumerate": enumerate,
+    "zip": zip,
+    "any": any,
+    "all": all,
+    "abs": abs,
+    "round": round,
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "list": list,
+    "dict": dict,
+}
+SAFE_METHODS = frozenset(
+    {
+        "get", "items", "keys", "values", "append", "extend",
+        "startswith", "endswith", "lower", "upper", "strip", "split", "join", "replace",
+    }
+)
+ALLOWED_NODES = (
+    ast.Module, ast.Expr, ast.Assign, ast.AugAssign, ast.For, ast.If, ast.Return,
+    ast.Pass, ast.Break, ast.Continue, ast.Name, ast.Constant, ast.Call, ast.keyword,
+    ast.Attribute, ast.List, ast.Tuple, ast.Dict, ast.Subscript, ast.Slice,
+    ast.Compare, ast.BoolOp, ast.UnaryOp, ast.BinOp, ast.IfExp, ast.ListComp,
+    ast.comprehension, ast.JoinedStr, ast.FormattedValue,
+    ast.operator, ast.cmpop, ast.boolop, ast.unaryop, ast.expr_context,
+)
+
+
+class ProgramCancelled(Exception):
+    """Raised by a tool call made after the program's time limit."""
+
+
+def _validate(tree: ast.AST, callables) -> str:
+    """Returns an error message if the program uses anything outside the whitelist."""
+    for node in ast.walk(tree):
+        if not isinstance(node, ALLOWED_NODES):
+            return f"{type(node).__name__} is not allowed in tool programs"
+        if isinstance(node, ast.Name) and node.id.startswith("_"):
+            return f"Name '{node.id}' is not allowed"
+        if isinstance(node, ast.Attribute) and node.attr not in SAFE_METHODS:
+            return f"Attribute '{node.attr}' is not allowed"
+        if isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Name) and func.id not in callables:
+                return f"Unknown function: {func.id}"
+            if not isinstance(func, (ast.Name, ast.Attribute)):
+                return "Only direct tool and method calls are allowed"
+    return ""
+
+
+def _as_function(tree: ast.Module) -> ast.Module:
+    """
+    Wraps the parsed program in `def _program(): ...; return None`.
+    Built on the AST rather than by indenting the source, which would also indent multi-line strings.
+    """
+    program = ast.FunctionDef(
+        name="_program",
+        args=ast.arguments(posonlyargs=[], args=[], vararg=None, kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[]),
+        body=[*tree.body, ast.Return(value=ast.Constant(value=None))],
+        decorator_list=[],
+        returns=None,
+        type_params=[],
+    )
+    return ast.fix_missing_locations(ast.Module(body=[program], type_ignores=[]))
+
+
+def run_tool_program(code: str, functions: Dict[str, Callable], timeout: float = PROGRAM_TIMEOUT) -> Dict[str, Any]:
+    """
+    Runs a short, restricted Python snippet that chains tool calls locally.
+    The snippet can call any tool in `functions` and `return` a value for the model.
+    """
+    if len(code) > MAX_PROGRAM_CHARS:
+        return {"error": f"Program too long: {len(code)} characters (max {MAX_PROGRAM_CHARS})"}
+
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        return {"error": f"Syntax error in program: line {e.lineno}: {e.msg}"}
+
+    # set on timeout, the abandoned program can't start another tool after that
+    cancelled = threading.Event()
+
+    def guarded(name, fn):
+        def call(*args, **kwargs):
+            if cancelled.is_set():
+                raise ProgramCancelled(f"Program was cancelled, {name} was not run")
+            return fn(*args, **kwargs)
+        return call
+
+    callables = {**SAFE_BUILTINS, **{name: guarded(name, fn) for name, fn in functions.items()}}
+    error = _validate(tree, callables)
+    if error:
+        return {"error": error}
+
+    namespace = {"__builtins__": {}, **callables}
+    try:
+        exec(compile(_as_function(tree), "<tool_program>", "exec"), namespace)
+    except SyntaxError as e:
+        return {"error": f"Syntax error in program: {e.msg}"}
+
+    # run in a daemon thread so a runaway program can't hold the agent hostage
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = namespace["_program"]()
+        except Exception as e:
+            outcome["error"] = f"Program error: {type(e).__name__}: {str(e)}"
+
+    worker = threading.Thread(target=target, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        cancelled.set()
+        return {"error": f"Program timed out after {timeout} seconds, tools it hadn't started yet were not run"}
+    return outcome
@@ -1,41 +1,83 @@
 import os
+from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
+MODEL_NAMES = {
+    "2.5-pro": "models/gemini-2.5-pro",
+    "2.5-flash": "models/gemini-2.5-flash",
+    "3.0-pro": "gemini-3-pro-preview", # The 3.0 Models haven't been tested.
+    "3.0-flash": "gemini-3-flash-preview"
+}
+DEFAULT_MODEL_NAME = "models/gemini-2.5-flash-preview-05-20"  # Default flash
 
+
+@dataclass(frozen=True, slots=True)
 class AgentConfig:
-    """Configurations for the AI agent."""
-
-    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-    if not GEMINI_API_KEY:
-        print("GEMINI_API_KEY not found!")
-        print("Please create a .env file in your project root with:")
-        print("GEMINI_API_KEY=your_api_key_here")
-        print("Or set it as an environment variable.")
-
-    _MODEL_CHOICE = os.getenv("GEMINI_MODEL", "2.5-flash").lower()
-    MODEL_NAME = {
-        "2.5-pro": "models/gemini-2.5-pro",
-        "2.5-flash": "models/gemini-2.5-flash",
-        "3.0-pro": "gemini-3-pro-preview", # The 3.0 Models haven't been tested.
-        "3.0-flash": "gemini-3-flash-preview"
-    }.get(_MODEL_CHOICE, "models/gemini-2.5-flash-preview-05-20")  # Default flash
-
-    TEMPERATURE = float(os.getenv("TEMPERATURE", 0.7))
-    TOP_K = int(os.getenv("TOP_K", 40))
-    TOP_P = float(os.getenv("TOP_P", 0.95))
-    MAX_TOKENS = int(os.getenv("MAX_TOKENS", 2048))
-    MAX_ITERATIONS = int(
-        os.getenv("MAX_ITERATIONS", 15)
-    )  
+    """Configurations for the AI agent, resolved once by from_env()."""
+
+    GEMINI_API_KEY: Optional[str] = None
+    MODEL_NAME: str = DEFAULT_MODEL_NAME
+
+    TEMPERATURE: float = 0.7
+    TOP_K: int = 40
+    TOP_P: float = 0.95
+    MAX_TOKENS: int = 2048
+    MAX_ITERATIONS: int = 15
+    # Older turns get summarized once the history grows past this many (approx.) tokens
+    HISTORY_TOKEN_BUDGET: int = 16000
+    KEEP_LAST_TURNS: int = 6
+    # Hard cap on turns kept after the bootstrap, the oldest are dropped first
+    MAX_HISTORY: int = 200
+    # How many prompts run_batch works on at once
+    BATCH_CONCURRENCY: int = 4
 
     # Set ENABLE_MEMORY=true in your environment to activate it.
     # switched off due to slownesss..
-    ENABLE_MEMORY = os.getenv("ENABLE_MEMORY", "false").lower() == "true"
+    ENABLE_MEMORY: bool = False
+
+    EMBEDDING_MODEL: str = "all-MiniLM-L6-v2"
+    # auto = fp16 on CUDA, int8 on CPU. Set fp32 to run the model unquantized.
+    EMBEDDING_PRECISION: str = "auto"
+    MEMORY_DB_PATH: str = ".chroma_db"
+    # Inputs shorter than this many words don't trigger a memory lookup
+    MEMORY_MIN_TOKENS: int = 3
+
+    # Responses are only cached when TEMPERATURE=0, set a path to persist them on disk.
+    LLM_CACHE_PATH: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> "AgentConfig":
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            print("GEMINI_API_KEY not found!")
+            print("Please create a .env file in your project root with:")
+            print("GEMINI_API_KEY=your_api_key_here")
+            print("Or set it as an environment variable.")
+
+        model_choice = os.getenv("GEMINI_MODEL", "2.5-flash").lower()
 
-    EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
-    MEMORY_DB_PATH = os.getenv("MEMORY_DB_PATH", ".chroma_db")
+        return cls(
+            GEMINI_API_KEY=api_key,
+            MODEL_NAME=MODEL_NAMES.get(model_choice, DEFAULT_MODEL_NAME),
+            TEMPERATURE=float(os.getenv("TEMPERATURE", 0.7)),
+            TOP_K=int(os.getenv("TOP_K", 40)),
+            TOP_P=float(os.getenv("TOP_P", 0.95)),
+            MAX_TOKENS=int(os.getenv("MAX_TOKENS", 2048)),
+            MAX_ITERATIONS=int(os.getenv("MAX_ITERATIONS", 15)),
+            HISTORY_TOKEN_BUDGET=int(os.getenv("HISTORY_TOKEN_BUDGET", 16000)),
+            KEEP_LAST_TURNS=int(os.getenv("KEEP_LAST_TURNS", 6)),
+            MAX_HISTORY=int(os.getenv("MAX_HISTORY", 200)),
+            BATCH_CONCURRENCY=int(os.getenv("BATCH_CONCURRENCY", 4)),
+            ENABLE_MEMORY=os.getenv("ENABLE_MEMORY", "false").lower() == "true",
+            EMBEDDING_MODEL=os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2"),
+            EMBEDDING_PRECISION=os.getenv("EMBEDDING_PRECISION", "auto").lower(),
+            MEMORY_DB_PATH=os.getenv("MEMORY_DB_PATH", ".chroma_db"),
+            MEMORY_MIN_TOKENS=int(os.getenv("MEMORY_MIN_TOKENS", 3)),
+            LLM_CACHE_PATH=os.getenv("LLM_CACHE_PATH"),
+        )
 
 
-config = AgentConfig()
+config = AgentConfig.from_env()
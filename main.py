@@ -1,13 +1,60 @@
+import argparse
+import asyncio
+import contextlib
+import json
+import sys
 import warnings
 # This blocks the deprecation error thrown by Chromadb usage...
 warnings.filterwarnings("ignore", category=FutureWarning)
 
+from rich.console import Console
+
 from agent.gemini_agent import GeminiAgent
 
+
+def load_prompts(path):
+    """
+    Reads prompts for batch mode, one per line.
+    Lines may be JSON strings/objects with a "prompt" key (.jsonl) or plain text.
+    """
+    source = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    prompts = []
+    with source:
+        for line in source:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                item = line
+            prompts.append(item["prompt"] if isinstance(item, dict) else str(item))
+    return prompts
+
+
 def main():
+    parser = argparse.ArgumentParser(description="AICOOK - Your Personal AI Assistant")
+    parser.add_argument("--batch", metavar="FILE", help="Answer the prompts in FILE (.jsonl, or - for stdin) non-interactively")
+    args = parser.parse_args()
+
+    batch_file = args.batch or (None if sys.stdin.isatty() else "-")
+
     agent = GeminiAgent()
     try:
-        agent.run()
+        if batch_file:
+            # keep stdout clean for the results
+            agent.console = Console(stderr=True)
+            prompts = load_prompts(batch_file)
+            # tools print progress/warnings, send those to stderr while the batch runs
+            with contextlib.redirect_stdout(sys.stderr):
+                responses = agent.run_batch(prompts)
+            for prompt, response in zip(prompts, responses):
+                if isinstance(response, BaseException):
+                    print(json.dumps({"prompt": prompt, "error": f"{type(response).__name__}: {response}"}))
+                else:
+                    print(json.dumps({"prompt": prompt, "response": response}))
+        else:
+            asyncio.run(agent.arun())
     except KeyboardInterrupt as e:
         print(f"Process interrupted: {e}")
     except Exception as e:
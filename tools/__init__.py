@@ -1,4 +1,12 @@
+import importlib
 
-from .file_system import *
-from .mysql_tools import *
-from .system import *
+# Submodules are imported on first attribute access, mysql-connector & co. are slow to load.
+_SUBMODULES = ("file_system", "mysql_tools", "system")
+
+
+def __getattr__(name):
+    for module_name in _SUBMODULES:
+        module = importlib.import_module(f".{module_name}", __name__)
+        if hasattr(module, name):
+            return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
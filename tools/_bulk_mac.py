@@ -0,0 +1,108 @@
+"""
+Directory listing with name, mtime and size in bulk on macOS, via getattrlistbulk(2).
+
+One syscall returns a whole buffer of entries instead of a readdir + stat per file.
+Only usable on macOS 10.10+, callers should fall back to os.scandir on OSError.
+"""
+import ctypes
+import ctypes.util
+import os
+import struct
+from typing import Iterator, Tuple
+
+ATTR_BIT_MAP_COUNT = 5
+ATTR_CMN_NAME = 0x00000001
+ATTR_CMN_MODTIME = 0x00000400
+ATTR_CMN_ERROR = 0x20000000
+ATTR_CMN_RETURNED_ATTRS = 0x80000000
+ATTR_FILE_TOTALSIZE = 0x00000002
+FSOPT_PACK_INVAL_ATTRS = 0x00000008
+
+BUFFER_SIZE = 256 * 1024
+
+
+class _AttrList(ctypes.Structure):
+    _fields_ = [
+        ("bitmapcount", ctypes.c_ushort),
+        ("reserved", ctypes.c_uint16),
+        ("commonattr", ctypes.c_uint32),
+        ("volattr", ctypes.c_uint32),
+        ("dirattr", ctypes.c_uint32),
+        ("fileattr", ctypes.c_uint32),
+        ("forkattr", ctypes.c_uint32),
+    ]
+
+
+_libc = None
+
+
+def _getattrlistbulk():
+    global _libc
+    if _libc is None:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        _libc.getattrlistbulk.argtypes = [
+            ctypes.c_int, ctypes.POINTER(_AttrList), ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint64
+        ]
+        _libc.getattrlistbulk.restype = ctypes.c_int
+    return _libc.getattrlistbulk
+
+
+def _parse_entry(buf: bytes, start: int) -> Tuple[int, str, float, int]:
+    """
+    Decodes one packed entry, returns (length, name, mtime, size), size -1 on a per-entry error.
+    FSOPT_PACK_INVAL_ATTRS keeps every requested field in place, the returned set says which are valid.
+    """
+    (length,) = struct.unpack_from("=I", buf, start)
+    common, _vol, _dir, file_attrs, _fork = struct.unpack_from("=5I", buf, start + 4)
+    error, name_offset, name_length, sec, nsec, total_size = struct.unpack_from("=IiIqqq", buf, start + 24)
+
+    if common & ATTR_CMN_ERROR and error:
+        return length, "", 0.0, -1
+
+    name = ""
+    if common & ATTR_CMN_NAME:
+        # the offset is relative to the attrreference_t itself, length includes the NUL
+        name_start = start + 28 + name_offset
+        name = buf[name_start:name_start + name_length - 1].decode("utf-8", "surrogateescape")
+
+    mtime = sec + nsec / 1e9 if common & ATTR_CMN_MODTIME else 0.0
+    size = total_size if file_attrs & ATTR_FILE_TOTALSIZE else 0
+    return length, name, mtime, size
+
+
+def bulk_listing(directory: str) -> Iterator[Tuple[str, float, int]]:
+    """
+    Yields (name, mtime, size) for every entry in `directory`, size is 0 for directories.
+    Raises OSError if the directory can't be read or the syscall isn't there.
+    """
+    try:
+        getattrlistbulk = _getattrlistbulk()
+    except (OSError, AttributeError, TypeError) as e:
+        raise OSError(f"getattrlistbulk unavailable: {e}") from e
+
+    attrs = _AttrList(
+        bitmapcount=ATTR_BIT_MAP_COUNT,
+        commonattr=ATTR_CMN_RETURNED_ATTRS | ATTR_CMN_NAME | ATTR_CMN_MODTIME | ATTR_CMN_ERROR,
+        fileattr=ATTR_FILE_TOTALSIZE,
+    )
+    buffer = ctypes.create_string_buffer(BUFFER_SIZE)
+
+    fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        while True:
+            count = getattrlistbulk(fd, ctypes.byref(attrs), buffer, BUFFER_SIZE, FSOPT_PACK_INVAL_ATTRS)
+            if count < 0:
+                errno = ctypes.get_errno()
+                raise OSError(errno, os.strerror(errno), directory)
+            if count == 0:
+                return
+
+            raw = buffer.raw
+            start = 0
+            for _ in range(count):
+                length, name, mtime, size = _parse_entry(raw, start)
+                start += length
+                if size >= 0 and name:
+                    yield name, mtime, size
+    finally:
+        os.close(fd)
@@ -2,37 +2,193 @@ import os
 import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List
 import platform
+import fnmatch
 import glob
+import mmap
 import re
+import time
+
+import numpy as np
+
+from ._bulk_mac import bulk_listing
+from ._iouring_stat import batched_statx
 
 IS_WINDOWS = platform.system() == "Windows"
 IS_MACOS = platform.system() == "Darwin"
 IS_LINUX = platform.system() == "Linux"
 
+SEARCH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# files handed to the pool at a time, keeps pending futures bounded on huge trees
+SEARCH_CHUNK = 256
+# find_files only spreads a ** walk over threads when the base has more subdirectories than this
+PARALLEL_WALK_MIN_DIRS = 32
+
+def _iso(ts: float) -> str:
+    """Local-time ISO timestamp (to the second) without building a datetime per entry."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(ts))
+
+
+def _stat_entries(entries):
+    """lstat results for a directory listing (None where it failed), batched through io_uring on Linux."""
+    if IS_LINUX:
+        return batched_statx([entry.path for entry in entries])
+    stats = []
+    for entry in entries:
+        try:
+            stats.append(entry.stat(follow_symlinks=False))
+        except OSError:
+            stats.append(None)
+    return stats
+
+
+@lru_cache(maxsize=128)
+def _glob_matcher(part: str):
+    return re.compile(fnmatch.translate(part), re.IGNORECASE if IS_WINDOWS else 0).match
+
+
+def _scandir(directory: str):
+    try:
+        with os.scandir(directory) as it:
+            return list(it)
+    except OSError:
+        # unreadable directories are skipped, like Path.glob does
+        return []
+
+
+def _iter_matching(base: str, pattern: str):
+    """
+    Yields os.DirEntry objects under base that match a glob pattern, like Path.glob.
+    Built on os.scandir so file type checks come from the directory listing, no extra stat.
+    """
+    parts = _glob_parts(pattern)
+    if parts:
+        yield from _walk_parts(base, parts)
+
+
+def _glob_parts(pattern: str):
+    return [p for p in pattern.replace("\\", "/").split("/") if p not in ("", ".")]
+
+
+def _walk_parts(directory: str, parts):
+    part, rest = parts[0], parts[1:]
+    entries = _scandir(directory)
+
+    if part == "**":
+        # zero or more directories, symlinked directories aren't followed
+        if rest:
+            yield from _walk_parts(directory, rest)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not rest:
+                    yield entry
+                yield from _walk_parts(entry.path, parts)
+        return
+
+    match = _glob_matcher(part)
+    for entry in entries:
+        if not match(entry.name):
+            continue
+        if not rest:
+            yield entry
+        elif entry.is_dir():
+            yield from _walk_parts(entry.path, rest)
+
+
+def _walk_match(root: str, parts) -> List[str]:
+    """Thread pool worker, walks one subtree to a list of paths."""
+    return [entry.path for entry in _walk_parts(root, parts)]
+
+
+def _find_matching(base: str, pattern: str) -> List[str]:
+    """
+    Paths under base matching the glob. A leading ** over a wide tree is split by
+    top-level subdirectory across a thread pool (scandir/stat release the GIL, and unlike
+    forked processes threads are safe next to the agent's asyncio/gRPC threads),
+    results keep the sequential order.
+    """
+    parts = _glob_parts(pattern)
+    if not parts or parts[0] != "**":
+        return [entry.path for entry in _iter_matching(base, pattern)]
+
+    subdirs = [entry for entry in _scandir(base) if entry.is_dir(follow_symlinks=False)]
+    if len(subdirs) <= PARALLEL_WALK_MIN_DIRS:
+        return [entry.path for entry in _iter_matching(base, pattern)]
+
+    rest = parts[1:]
+    files = _walk_match(base, rest) if rest else []
+    with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+        matches = executor.map(
+            _walk_match,
+            [entry.path for entry in subdirs],
+            [parts] * len(subdirs)
+        )
+        for entry, sub_matches in zip(subdirs, matches):
+            if not rest:
+                files.append(entry.path)
+            files.extend(sub_matches)
+    return files
+
+
+def _search_buffer(search, data: str, file_path: str):
+    """
+    Scans a whole file in one go, one result per matching line.
+    A candidate match is re-checked within its own line, so patterns like \\s* can't report
+    a line just because the match started there and ran on into the next one.
+    After a hit (or a rejected candidate) the scan resumes on the next line.
+    """
+    pos = 0
+    line_num = 1
+    counted_to = 0
+    size = len(data)
+    while pos < size:
+        match = search(data, pos)
+        if match is None:
+            break
+        start = match.start()
+        line_start = data.rfind("\n", 0, start) + 1
+        line_end = data.find("\n", start)
+        if line_end == -1:
+            line_end = size
+        pos = line_end + 1
+        if search(data, line_start, line_end) is None:
+            continue
+        line_num += data.count("\n", counted_to, line_start)
+        counted_to = line_start
+        yield {
+            "file_path": file_path,
+            "line_number": line_num,
+            "line_content": data[line_start:line_end].strip()
+        }
+
+def _scan_one(file: str, search):
+    """Search results for one file, each worker returns its own list so nothing is shared."""
+    try:
+        with open(file, "r", encoding="utf-8", errors="ignore") as f:
+            data = f.read()
+        return list(_search_buffer(search, data, file))
+    except Exception as e:
+        # ignore files that can't be opened
+        print(f"Could not read file {file}: {e}")
+        return []
+
 def search_text(pattern: str, file_pattern: str, base_path: str = ".") -> Dict[str, Any]:
     """
     Search for a text pattern in files matching a glob pattern.
     """
     try:
         path = Path(base_path).expanduser().resolve()
-        files = [p for p in path.glob(file_pattern) if p.is_file()]
+        # compile once, MULTILINE keeps ^ and $ anchored to lines as before
+        search = re.compile(pattern, re.MULTILINE).search
+        files = [entry.path for entry in _iter_matching(str(path), file_pattern) if entry.is_file()]
         results = []
-        for file in files:
-            try:
-                with open(file, "r", encoding="utf-8", errors="ignore") as f:
-                    for line_num, line in enumerate(f, 1):
-                        if re.search(pattern, line):
-                            results.append({
-                                "file_path": str(file),
-                                "line_number": line_num,
-                                "line_content": line.strip()
-                            })
-            except Exception as e:
-                # ignore files that can't be opened
-                print(f"Could not read file {file}: {e}")
-                continue
+        with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as executor:
+            for start in range(0, len(files), SEARCH_CHUNK):
+                for partial in executor.map(lambda file: _scan_one(file, search), files[start:start + SEARCH_CHUNK]):
+                    results.extend(partial)
         return {"results": results}
     except Exception as e:
         return {"error": f"Failed to search for text: {str(e)}"}
@@ -43,11 +199,37 @@ def find_files(pattern: str, base_path: str = ".") -> Dict[str, Any]:
     """
     try:
         path = Path(base_path).expanduser().resolve()
-        files = [str(p) for p in path.glob(pattern)]
+        files = _find_matching(str(path), pattern)
         return {"files": files}
     except Exception as e:
         return {"error": f"Failed to find files: {str(e)}"}
 
+def _trash_listing(trash_path: str):
+    """Names, mtimes and sizes of the trash entries, in one getattrlistbulk loop on macOS."""
+    names = []
+    mtimes = []
+    sizes = []
+    if IS_MACOS:
+        try:
+            for name, mtime, size in bulk_listing(trash_path):
+                names.append(name)
+                mtimes.append(mtime)
+                sizes.append(size)
+            return names, mtimes, sizes
+        except OSError:
+            names, mtimes, sizes = [], [], []
+
+    with os.scandir(trash_path) as it:
+        listing = list(it)
+    for entry, stat_info in zip(listing, _stat_entries(listing)):
+        if stat_info is None:
+            continue
+        names.append(entry.name)
+        mtimes.append(stat_info.st_mtime)
+        sizes.append(stat_info.st_size)
+    return names, mtimes, sizes
+
+
 def check_trash_bin(days_threshold: int = 10) -> Dict[str, Any]:
     """
     Check Trash/Recycle Bin for files older than specified days
@@ -77,40 +259,39 @@ def check_trash_bin(days_threshold: int = 10) -> Dict[str, Any]:
         if not trash_path.exists():
             return {"error": f"Trash directory not found: {trash_path}"}
 
-        old_files = []
-        total_files = 0
-        total_size = 0
-        cutoff_date = datetime.now() - timedelta(days=days_threshold)
+        # one pass collects the stats, the filtering and totals then run on arrays
+        names, mtimes, sizes = _trash_listing(str(trash_path))
 
-        for item in trash_path.iterdir():
-            try:
-                stat_info = item.stat()
-                file_date = datetime.fromtimestamp(stat_info.st_mtime)
-                file_size = stat_info.st_size
-                total_files += 1
-                total_size += file_size
-
-                if file_date < cutoff_date:
-                    old_files.append({
-                        "name": item.name,
-                        "path": str(item),
-                        "size": file_size,
-                        "modified": file_date.isoformat(),
-                        "days_old": (datetime.now() - file_date).days
-                    })
-            except (OSError, PermissionError):
-                continue
+        mtimes = np.array(mtimes, dtype=np.float64)
+        sizes = np.array(sizes, dtype=np.int64)
+        now = datetime.now()
+        now_ts = now.timestamp()
+        cutoff_date = now - timedelta(days=days_threshold)
+        old_mask = mtimes < cutoff_date.timestamp()
+        old_indices = np.flatnonzero(old_mask)
+
+        old_files = []
+        # only the first 20 are returned, so only those become dicts
+        for i in old_indices[:20]:
+            mtime = float(mtimes[i])
+            old_files.append({
+                "name": names[i],
+                "path": os.path.join(trash_path, names[i]),
+                "size": int(sizes[i]),
+                "modified": _iso(mtime),
+                "days_old": int((now_ts - mtime) // 86400)
+            })
 
         result = {
             "trash_path": str(trash_path),
             "platform": platform.system(),
-            "total_files": total_files,
-            "total_size": total_size,
-            "old_files_count": len(old_files),
-            "old_files": old_files[:20],  # for cleaner display
-            "size_to_free": sum(f["size"] for f in old_files),
+            "total_files": len(names),
+            "total_size": int(sizes.sum()),
+            "old_files_count": len(old_indices),
+            "old_files": old_files,  # first 20, for cleaner display
+            "size_to_free": int(sizes[old_mask].sum()),
             "days_threshold": days_threshold,
-            "scan_timestamp": datetime.now().isoformat()
+            "scan_timestamp": now.isoformat()
         }
 
         return result
@@ -168,6 +349,22 @@ def clean_old_trash_files(days_threshold: int = 10, confirm: bool = True) -> Dic
         return {"error": f"Failed to clean trash: {str(e)}"}
 
 
+def _head_end(mm, max_lines: int):
+    """Number of lines in the first max_lines, and the byte offset where they end."""
+    end = 0
+    lines = 0
+    while lines < max_lines:
+        newline = mm.find(b"\n", end)
+        if newline < 0:
+            if end < len(mm):
+                end = len(mm)
+                lines += 1
+            break
+        end = newline + 1
+        lines += 1
+    return lines, end
+
+
 def read_file_content(file_path: str, max_lines: int = 500) -> Dict[str, Any]:
     """
     Read and analyze file content
@@ -181,7 +378,8 @@ def read_file_content(file_path: str, max_lines: int = 500) -> Dict[str, Any]:
             return {"error": f"Path is not a file: {file_path}"}
 
         # Check file size (limit to 1MB for safety), 
-        file_size = path.stat().st_size
+        stat_info = path.stat()
+        file_size = stat_info.st_size
         if file_size > (1024 * 1024):
             return {"error": f"File too large: {file_size} bytes (max 1MB)"}
 
@@ -197,20 +395,28 @@ def read_file_content(file_path: str, max_lines: int = 500) -> Dict[str, Any]:
 
         # check content
         try:
-            with open(path, 'r', encoding='utf-8') as f: # Use encoding='utf-8', Windows kinda has issues with default encoding
-                lines = f.readlines()
-                content = ''.join(lines[:max_lines])
+            content = ""
+            head_lines = total_lines = 0
+            if file_size:
+                # map the file and decode only the head, the rest is counted in place
+                with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    head_lines, end = _head_end(mm, max_lines)
+                    # decode as utf-8 explicitly, Windows kinda has issues with default encoding
+                    content = mm[:end].decode('utf-8').replace('\r\n', '\n')
+                    total_lines = head_lines + mm[end:].count(b"\n")
+                    if end < len(mm) and mm[-1:] != b"\n":
+                        total_lines += 1  # final line without a newline
 
             result = {
                 "file_path": str(path),
                 "file_type": file_type,
                 "file_extension": suffix,
-                "total_lines": len(lines),
-                "content_lines_read": min(len(lines), max_lines),
+                "total_lines": total_lines,
+                "content_lines_read": head_lines,
                 "content": content,
                 "file_size": file_size,
-                "last_modified": datetime.fromtimestamp(path.stat().st_mtime).isoformat(),
-                "is_truncated": len(lines) > max_lines
+                "last_modified": _iso(stat_info.st_mtime),
+                "is_truncated": total_lines > max_lines
             }
 
             return result
@@ -222,6 +428,38 @@ def read_file_content(file_path: str, max_lines: int = 500) -> Dict[str, Any]:
         return {"error": f"Failed to read file: {str(e)}"}
 
 
+# Linux ioctl that clones a file's extents on btrfs/xfs (fcntl.FICLONE only exists on 3.12+)
+FICLONE = 0x40049409
+
+
+def _cow_copy(src: Path, dst: Path) -> None:
+    """
+    Copy-on-write clone of src to dst (FICLONE on Linux, clonefile on macOS),
+    no data is copied. Falls back to shutil.copy2 where the filesystem can't clone.
+    """
+    if IS_LINUX:
+        try:
+            import fcntl
+            with open(src, 'rb') as src_f, open(dst, 'wb') as dst_f:
+                fcntl.ioctl(dst_f.fileno(), getattr(fcntl, "FICLONE", FICLONE), src_f.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    elif IS_MACOS:
+        try:
+            import ctypes
+            import ctypes.util
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            # clonefile keeps the metadata, like copy2
+            if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                return
+        except (OSError, AttributeError):
+            pass
+
+    shutil.copy2(src, dst)
+
+
 def write_file_content(file_path: str, content: str, backup: bool = True) -> Dict[str, Any]:
     """
     Write content to file with optional backup
@@ -229,12 +467,14 @@ def write_file_content(file_path: str, content: str, backup: bool = True) -> Dic
     try:
         path = Path(file_path).expanduser()
         backup_path = None
+        # one clock read names the backup and stamps the result
+        now = datetime.now()
 
         # Create backup 
         if path.exists() and backup:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             backup_path = path.with_suffix(f".backup_{timestamp}{path.suffix}")
-            shutil.copy2(path, backup_path)
+            _cow_copy(path, backup_path)
 
         # Write content
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -247,7 +487,7 @@ def write_file_content(file_path: str, content: str, backup: bool = True) -> Dic
             "backup_path": str(backup_path) if backup_path else None,
             "content_length": len(content),
             "lines_written": content.count('\n') + 1,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now.isoformat()
         }
 
         return result
@@ -272,30 +512,30 @@ def list_directory_contents(dir_path: str = ".", show_hidden: bool = False) -> D
         directories = []
         total_size = 0
 
-        for item in path.iterdir():
-            if not show_hidden and item.name.startswith('.'):
-                continue
+        with os.scandir(path) as it:
+            listing = [entry for entry in it if show_hidden or not entry.name.startswith('.')]
 
-            try:
-                stat_info = item.stat()
-                item_info = {
-                    "name": item.name,
-                    "path": str(item),
-                    "is_directory": item.is_dir(),
-                    "size": stat_info.st_size if item.is_file() else 0,
-                    "modified": datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
-                    "permissions": oct(stat_info.st_mode)[-3:]
-                }
-
-                if item.is_dir():
-                    directories.append(item_info)
-                else:
-                    files.append(item_info)
-                    total_size += item_info["size"]
-
-            except (OSError, PermissionError):
+        for entry, stat_info in zip(listing, _stat_entries(listing)):
+            if stat_info is None:
                 continue
 
+            # is_dir/is_file come from the directory listing, no extra stat
+            is_dir = entry.is_dir(follow_symlinks=False)
+            item_info = {
+                "name": entry.name,
+                "path": entry.path,
+                "is_directory": is_dir,
+                "size": stat_info.st_size if entry.is_file(follow_symlinks=False) else 0,
+                "modified": _iso(stat_info.st_mtime),
+                "permissions": oct(stat_info.st_mode)[-3:]
+            }
+
+            if is_dir:
+                directories.append(item_info)
+            else:
+                files.append(item_info)
+                total_size += item_info["size"]
+
         result = {
             "directory_path": str(path),
             "total_files": len(files),
@@ -1,9 +1,45 @@
 import chromadb
-from sentence_transformers import SentenceTransformer, util
+import numpy as np
+import torch
+from sentence_transformers import SentenceTransformer
 from typing import List, Dict, Any
-from datetime import datetime
 from config.settings import config
+import atexit
+import functools
 import hashlib
+import threading
+import time
+
+# remember() buffers new facts and writes them to Chroma in one add once this many are pending
+FLUSH_BATCH_SIZE = 64
+
+
+# Loading the model and opening the DB are the slow parts, so do it once per process.
+@functools.lru_cache(maxsize=None)
+def _get_model(name: str, precision: str = "fp32") -> SentenceTransformer:
+    model = SentenceTransformer(name)
+    if precision == "auto":
+        precision = "fp16" if torch.cuda.is_available() else "int8"
+    if precision == "fp16" and model.device.type == "cuda":
+        model.half()
+    elif precision == "int8":
+        # dynamic int8 for the Linear layers, that's where CPU encode time goes
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return model
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(path: str):
+    return chromadb.PersistentClient(path=path)
+
+
+def _cosine(query: np.ndarray, embeddings) -> np.ndarray:
+    """Cosine similarity of `query` against each stored embedding."""
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if matrix.size == 0:
+        return np.empty(0, dtype=np.float32)
+    return matrix @ query / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(query))
+
 
 class MemoryManager:
     def __init__(self, similarity_threshold: float = 0.85):
@@ -11,49 +47,91 @@ class MemoryManager:
         Initializes the MemoryManager with a persistent ChromaDB client.
         Includes semantic deduplication and smart memory handling.
         """
-        self.client = chromadb.PersistentClient(path=config.MEMORY_DB_PATH)
+        self.client = _get_client(config.MEMORY_DB_PATH)
         self.collection = self.client.get_or_create_collection("agent_memory")
-        self.model = SentenceTransformer(config.EMBEDDING_MODEL)
+        # kept up to date on add/delete, saves a count() roundtrip per call
+        self._count = self.collection.count()
+        self.model = _get_model(config.EMBEDDING_MODEL, config.EMBEDDING_PRECISION)
         self.similarity_threshold = similarity_threshold
+        # doc_id -> (embedding, fact, metadata), written by flush()
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def flush(self) -> None:
+        """
+        Writes the buffered facts to the collection in a single add.
+        recall and forget flush first, so they always see everything remembered so far.
+        If the add fails the facts stay buffered and the error is raised.
+        """
+        with self._pending_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+        try:
+            self.collection.add(
+                embeddings=[embedding.tolist() for embedding, _, _ in pending.values()],
+                documents=[fact for _, fact, _ in pending.values()],
+                ids=list(pending),
+                metadatas=[metadata for _, _, metadata in pending.values()]
+            )
+        except Exception:
+            # remember() already reported these as saved, keep them queued for the next flush
+            with self._pending_lock:
+                for doc_id, entry in pending.items():
+                    self._pending.setdefault(doc_id, entry)
+            raise
+        self._count += len(pending)
 
     def _generate_id(self, fact: str) -> str:
-        """Generates a consistent unique ID using SHA256."""
-        return hashlib.sha256(fact.encode('utf-8')).hexdigest()
+        """Generates a consistent unique ID using BLAKE2b (128-bit, not used for security)."""
+        return hashlib.blake2b(fact.encode('utf-8'), digest_size=16).hexdigest()
 
-    def _is_duplicate(self, fact: str, top_k: int = 5) -> bool:
-        """Checks if a semantically similar memory already exists."""
-        if self.collection.count() == 0:
+    def _candidate_embeddings(self, results) -> np.ndarray:
+        """
+        Vectors of the query candidates. Chroma returns them with include=["embeddings"],
+        if it didn't, all candidates are re-encoded in a single batched forward pass.
+        """
+        embeddings = results.get("embeddings")
+        if embeddings is not None and embeddings[0] is not None:
+            return embeddings[0]
+        documents = results.get("documents", [[]])[0]
+        return self.model.encode(documents, batch_size=max(len(documents), 1), convert_to_numpy=True)
+
+    def _is_duplicate(self, embedding: np.ndarray, top_k: int = 5) -> bool:
+        """Checks if a semantically similar memory already exists, buffered ones included."""
+        with self._pending_lock:
+            pending = [entry[0] for entry in self._pending.values()]
+        if pending and (_cosine(embedding, pending) >= self.similarity_threshold).any():
+            return True
+        if self._count == 0:
             return False
 
-        embedding = self.model.encode(fact)
+        # compare against the stored vectors instead of re-encoding the documents
         results = self.collection.query(
             query_embeddings=[embedding.tolist()],
-            n_results=top_k
+            n_results=top_k,
+            include=["documents", "embeddings"]
         )
-
-        for existing_fact in results.get("documents", [[]])[0]:
-            existing_embedding = self.model.encode(existing_fact)
-            similarity = util.cos_sim(embedding, existing_embedding).item()
-            if similarity >= self.similarity_threshold:
-                return True
-        return False
+        similarities = _cosine(embedding, self._candidate_embeddings(results))
+        return bool((similarities >= self.similarity_threshold).any())
 
     def remember(self, fact: str) -> Dict[str, Any]:
         """Saves a fact to memory after checking for duplication."""
         try:
-            if self._is_duplicate(fact):
+            # encoded once, used for the duplicate check and for storage
+            embedding = self.model.encode(fact, convert_to_numpy=True)
+            if self._is_duplicate(embedding):
                 return {"status": "skipped", "message": "Fact already exists (semantically similar)."}
 
-            embedding = self.model.encode(fact).tolist()
             doc_id = self._generate_id(fact)
-            metadata = {"timestamp": datetime.utcnow().isoformat()}
+            metadata = {"timestamp_ns": time.time_ns()}
 
-            self.collection.add(
-                embeddings=[embedding],
-                documents=[fact],
-                ids=[doc_id],
-                metadatas=[metadata]
-            )
+            with self._pending_lock:
+                self._pending[doc_id] = (embedding, fact, metadata)
+                full = len(self._pending) >= FLUSH_BATCH_SIZE
+            if full:
+                self.flush()
             return {"status": "success", "message": f"Remembered: {fact}"}
         except Exception as e:
             return {"status": "error", "message": str(e)}
@@ -61,9 +139,7 @@ class MemoryManager:
     def recall(self, query: str, top_n: int = 3) -> List[str]:
         """Returns the most relevant memories based on a query."""
         try:
-            if self.collection.count() == 0:
-                return []
-
+            self.flush()
             query_embedding = self.model.encode(query).tolist()
             results = self.collection.query(query_embeddings=[query_embedding], n_results=top_n)
             return results.get("documents", [[]])[0]
@@ -84,25 +160,29 @@ class MemoryManager:
         - Dict with status and optionally deleted or matched memories.
         """
         try:
-            if self.collection.count() == 0:
+            self.flush()
+            if self._count == 0:
                 return {"status": "empty", "message": "No memories to search."}
 
-            query_embedding = self.model.encode(fact)
-            results = self.collection.query(query_embeddings=[query_embedding.tolist()], n_results=top_n)
+            query_embedding = self.model.encode(fact, convert_to_numpy=True)
+            results = self.collection.query(
+                query_embeddings=[query_embedding.tolist()],
+                n_results=top_n,
+                include=["documents", "embeddings"]
+            )
             candidates = results.get("documents", [[]])[0]
             ids = results.get("ids", [[]])[0]
+            similarities = _cosine(query_embedding, self._candidate_embeddings(results))
 
             deleted = []
             matched = []
 
-            for doc, doc_id in zip(candidates, ids):
-                doc_embedding = self.model.encode(doc)
-                similarity = util.cos_sim(query_embedding, doc_embedding).item()
-
+            for doc, doc_id, similarity in zip(candidates, ids, similarities.tolist()):
                 if similarity >= similarity_threshold:
                     matched.append({"fact": doc, "similarity": round(similarity, 3), "id": doc_id})
                     if confirm:
                         self.collection.delete(ids=[doc_id])
+                        self._count -= 1
                         deleted.append(doc)
 
             if not matched:
@@ -1,11 +1,135 @@
 
+import atexit
+import functools
 import getpass
-import mysql.connector
-from mysql.connector import Error
+import io
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from mysql.connector import Error, pooling
+from mysql.connector.errors import PoolError
 from typing import Dict, Any
 from datetime import datetime
 from pathlib import Path
 
+POOL_SIZE = 8
+# "This command is not supported in the prepared statement protocol yet"
+ER_UNSUPPORTED_PS = 1295
+_DB_NAME_RE = re.compile(r"[^A-Za-z0-9_]+")
+SYSTEM_DATABASES = ("information_schema", "mysql", "performance_schema", "sys")
+# SELECT results are read FETCH_SIZE rows at a time, and capped at MAX_ROWS by default
+FETCH_SIZE = 1024
+MAX_ROWS = 10000
+
+# Short-lived cache for the schema analysis and database listing, dropped on DDL
+SCHEMA_CACHE_TTL = 30
+_SCHEMA_CACHE: Dict[tuple, tuple] = {}
+_DDL_RE = re.compile(r"\b(CREATE|ALTER|DROP|RENAME|TRUNCATE)\b", re.IGNORECASE)
+
+# One pool per set of credentials, connections are reused across tool calls.
+# Pools start empty and open a connection only when every existing one is checked out.
+_pools: Dict[tuple, pooling.MySQLConnectionPool] = {}
+_pool_opened: Dict[tuple, int] = {}
+_pools_lock = threading.Lock()
+
+
+def _get_connection(credentials: Dict[str, Any]):
+    key = tuple(sorted((k, str(v)) for k, v in credentials.items()))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            # no credentials in the constructor, it would open all POOL_SIZE connections up front
+            pool = pooling.MySQLConnectionPool(pool_name=f"aicook_{len(_pools)}", pool_size=POOL_SIZE)
+            pool.set_config(**credentials)
+            _pools[key] = pool
+            _pool_opened[key] = 0
+        try:
+            return pool.get_connection()
+        except PoolError:
+            if _pool_opened[key] >= POOL_SIZE:
+                raise
+            _pool_opened[key] += 1
+
+    # the handshake happens outside the lock, other credentials aren't held up by it
+    try:
+        pool.add_connection()
+    except Exception:
+        with _pools_lock:
+            _pool_opened[key] -= 1
+        raise
+    return pool.get_connection()
+
+
+@contextmanager
+def _connection(credentials: Dict[str, Any], database: str = None):
+    """
+    Checks a connection out of the pool, switched to `database` if given.
+    The database isn't part of the pool key, closing returns it to the pool and resets the session.
+    """
+    connection = _get_connection(credentials)
+    try:
+        if database:
+            connection.cmd_init_db(database)
+        yield connection
+    finally:
+        connection.close()
+
+@functools.lru_cache(maxsize=128)
+def _sanitize_db_name(database_name: str) -> str:
+    """Keeps only ASCII letters, digits and underscores, lowercased."""
+    return _DB_NAME_RE.sub("", database_name).lower()
+
+def _schema_key(kind: str, credentials: Dict[str, Any], db_name: str = "") -> tuple:
+    # per user, what one account can see says nothing about another's privileges
+    return (kind, db_name, credentials.get("host"), credentials.get("port"), credentials.get("user"))
+
+def _cached_schema(key: tuple):
+    entry = _SCHEMA_CACHE.get(key)
+    if entry is not None and time.monotonic() - entry[0] < SCHEMA_CACHE_TTL:
+        return entry[1]
+    return None
+
+def _invalidate_schema(credentials: Dict[str, Any]) -> None:
+    """Forgets every cached structure/listing for the server these credentials point to."""
+    server = (credentials.get("host"), credentials.get("port"))
+    for key in [key for key in _SCHEMA_CACHE if key[2:4] == server]:
+        _SCHEMA_CACHE.pop(key, None)
+
+# Append handles for the per-database .sql logs, kept open across calls and flushed at exit
+_SQL_LOG_HANDLES: Dict[str, io.BufferedWriter] = {}
+_sql_log_lock = threading.Lock()
+
+def _close_sql_logs() -> None:
+    with _sql_log_lock:
+        for handle in _SQL_LOG_HANDLES.values():
+            handle.close()
+        _SQL_LOG_HANDLES.clear()
+
+atexit.register(_close_sql_logs)
+
+def _append_sql_log(sql_file_path: Path, text: str) -> None:
+    key = str(sql_file_path)
+    with _sql_log_lock:
+        handle = _SQL_LOG_HANDLES.get(key)
+        if handle is None:
+            handle = _SQL_LOG_HANDLES[key] = open(sql_file_path, "ab", buffering=1 << 16)
+        handle.write(text.encode())
+
+def _reset_sql_log(sql_file_path: Path, text: str) -> None:
+    """Starts the log over with `text`, the open append handle (if any) is closed first."""
+    with _sql_log_lock:
+        handle = _SQL_LOG_HANDLES.pop(str(sql_file_path), None)
+        if handle is not None:
+            handle.close()
+        with open(sql_file_path, "wb") as f:
+            f.write(text.encode())
+
+def _quote_identifier(name: str) -> str:
+    return "`" + name.replace("`", "``") + "`"
+
 def prompt_for_mysql_credentials() -> Dict[str, str]:
     """
     Prompts a user for the sql credentials, Handles all the inputs gracefully
@@ -39,61 +163,57 @@ def create_mysql_database(database_name: str, description: str = "", credentials
             return credentials
 
         # Clean database name
-        db_name = "".join(c for c in database_name if c.isalnum() or c in ('_')).lower()
+        db_name = _sanitize_db_name(database_name)
         if not db_name:
             return {"error": "Invalid database name"}
 
         # Connect to the server(mysql)
 
-        connection = mysql.connector.connect(**credentials)
-        cursor = connection.cursor()
-
-        # Create database
-        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {db_name}")
-        cursor.execute(f"USE {db_name}")
-
-        # Create metadata table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS _database_metadata (
-                metadata_key VARCHAR(255) PRIMARY KEY,
-                metadata_value TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Insert metadata
-        cursor.execute("""
-            INSERT INTO _database_metadata (metadata_key, metadata_value) 
-            VALUES (%s, %s)
-            ON DUPLICATE KEY UPDATE metadata_value = VALUES(metadata_value)
-        """, ("database_name", database_name))
-
-        cursor.execute("""
-            INSERT INTO _database_metadata (metadata_key, metadata_value) 
-            VALUES (%s, %s)
-            ON DUPLICATE KEY UPDATE metadata_value = VALUES(metadata_value)
-        """, ("description", description))
-
-        connection.commit()
-
-        # Create SQL file
+        with _connection(credentials) as connection:
+            cursor = connection.cursor()
+
+            # Create database, the name is sanitized already but still goes in as a quoted identifier
+            cursor.execute(f"CREATE DATABASE IF NOT EXISTS {_quote_identifier(db_name)}")
+            connection.cmd_init_db(db_name)
+
+            # Create metadata table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS _database_metadata (
+                    metadata_key VARCHAR(255) PRIMARY KEY,
+                    metadata_value TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            # Insert metadata, executemany sends both rows as one multi-row INSERT
+            cursor.executemany("""
+                INSERT INTO _database_metadata (metadata_key, metadata_value)
+                VALUES (%s, %s)
+                ON DUPLICATE KEY UPDATE metadata_value = VALUES(metadata_value)
+            """, [("database_name", database_name), ("description", description)])
+
+            connection.commit()
+
+            cursor.close()
+        _invalidate_schema(credentials)
+
+        # Create SQL file, stamped with the same time as the result
+        now_iso = datetime.now().isoformat()
         sql_file_path = Path(f"{db_name}.sql")
-        with open(sql_file_path, 'w') as f:
-            f.write(f"-- MySQL Database: {database_name}\n")
-            f.write(f"-- Created: {datetime.now().isoformat()}\n")
-            f.write(f"-- Description: {description}\n\n")
-            f.write(f"CREATE DATABASE IF NOT EXISTS {db_name};\n")
-            f.write(f"USE {db_name};\n\n")
-            f.write("-- Metadata table\n")
-            f.write("""
+        _reset_sql_log(sql_file_path, (
+            f"-- MySQL Database: {database_name}\n"
+            f"-- Created: {now_iso}\n"
+            f"-- Description: {description}\n\n"
+            f"CREATE DATABASE IF NOT EXISTS {db_name};\n"
+            f"USE {db_name};\n\n"
+            "-- Metadata table\n"
+            """
 CREATE TABLE IF NOT EXISTS _database_metadata (
                     metadata_key VARCHAR(255) PRIMARY KEY,
                     metadata_value TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
-                    """)
-
-        cursor.close()
-        connection.close()
+                    """
+        ))
 
         result = {
             "database_name": database_name,
@@ -101,7 +221,7 @@ CREATE TABLE IF NOT EXISTS _database_metadata (
             "sql_file": str(sql_file_path),
             "description": description,
             "host": credentials["host"],
-            "created_at": datetime.now().isoformat(),
+            "created_at": now_iso,
             "status": "created"
         }
 
@@ -112,72 +232,118 @@ CREATE TABLE IF NOT EXISTS _database_metadata (
     except Exception as e:
         return {"error": f"Failed to create MySQL database: {str(e)}"}
 
-def execute_mysql_command(database_name: str, sql_command: str, credentials: Dict[str, str] = None, save_to_file: bool = True) -> Dict[str, Any]:
+def _statement_result(cursor, statement: str, max_rows: int = MAX_ROWS) -> Dict[str, Any]:
+    """Result entry for the statement the cursor just ran, at most max_rows rows are kept (<= 0: all)."""
+    statement = statement.strip()
+    if max_rows <= 0:
+        max_rows = sys.maxsize
+    if cursor.with_rows:
+        # streamed in chunks so a huge SELECT never sits in memory twice
+        rows = []
+        truncated = False
+        while True:
+            chunk = cursor.fetchmany(FETCH_SIZE)
+            if not chunk:
+                break
+            room = max_rows - len(rows)
+            # function responses need lists, tuples don't convert
+            rows.extend(list(row) for row in chunk[:room])
+            if len(chunk) > room:
+                truncated = True
+                break
+        if truncated:
+            # drain what's left so the connection can run the next statement
+            while cursor.fetchmany(FETCH_SIZE):
+                pass
+        columns = [desc[0] for desc in cursor.description]
+        return {
+            "command": statement,
+            "type": statement.split()[0].upper(),
+            "rows": rows,
+            "columns": columns,
+            "row_count": len(rows),
+            "truncated": truncated
+        }
+    return {
+        "command": statement,
+        "type": statement.split()[0].upper(),
+        "rows_affected": cursor.rowcount,
+        "success": True
+    }
+
+def execute_mysql_command(database_name: str, sql_command: str, credentials: Dict[str, str] = None, save_to_file: bool = True, max_rows: int = MAX_ROWS) -> Dict[str, Any]:
     """
-    run sql command on database
+    run sql command on database, SELECTs return at most max_rows rows each (0 or less for no limit)
     """
     try:
         if not credentials:
             credentials = prompt_for_mysql_credentials()
         if "error" in credentials:
             return credentials
-        db_name = "".join(c for c in database_name if c.isalnum() or c in ('_')).lower()
+        db_name = _sanitize_db_name(database_name)
+        max_rows = int(max_rows)
 
         # connect to mysql db
-        connection = mysql.connector.connect(database=db_name, **credentials)
-        cursor = connection.cursor()
-
-        # handle case whereby multiple statements
-        commands = [cmd.strip() for cmd in sql_command.split(';') if cmd.strip()]
-        results = []
-
-        for cmd in commands:
-            try:
-                cursor.execute(cmd)
-
-                # Check if it's a SELECT statement
-                if cmd.upper().strip().startswith('SELECT'):
-                    rows = cursor.fetchall()
-                    columns = [desc[0] for desc in cursor.description]
+        with _connection(credentials, db_name) as connection:
+            # handle case whereby multiple statements
+            commands = [cmd.strip() for cmd in sql_command.split(';') if cmd.strip()]
+            results = []
+
+            if len(commands) == 1:
+                # a single statement goes through the binary protocol as a prepared statement
+                cursor = connection.cursor(prepared=True)
+                try:
+                    try:
+                        cursor.execute(commands[0])
+                    except Error as e:
+                        if e.errno != ER_UNSUPPORTED_PS:
+                            raise
+                        cursor.close()
+                        cursor = connection.cursor()
+                        cursor.execute(commands[0])
+                    results.append(_statement_result(cursor, commands[0], max_rows))
+                except Error as e:
                     results.append({
-                        "command": cmd,
-                        "type": "SELECT",
-                        "rows": [list(row) for row in rows],
-                        "columns": columns,
-                        "row_count": len(rows)
+                        "command": commands[0],
+                        "error": str(e),
+                        "success": False
                     })
-                else:
+                cursor.close()
+            elif commands:
+                # the whole batch is sent at once, the server runs it and returns one result per statement
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(sql_command, map_results=True)
+                    while True:
+                        results.append(_statement_result(cursor, cursor.statement, max_rows))
+                        if not cursor.nextset():
+                            break
+                except Error as e:
+                    # the server stops at the failing statement, later ones never run
                     results.append({
-                        "command": cmd,
-                        "type": cmd.split()[0].upper(),
-                        "rows_affected": cursor.rowcount,
-                        "success": True
+                        "command": commands[len(results)] if len(results) < len(commands) else sql_command,
+                        "error": str(e),
+                        "success": False
                     })
+                cursor.close()
 
-            except Error as e:
-                results.append({
-                    "command": cmd,
-                    "error": str(e),
-                    "success": False
-                })
+            connection.commit()
 
-        connection.commit()
-        cursor.close()
-        connection.close()
+        if _DDL_RE.search(sql_command):
+            _invalidate_schema(credentials)
 
         # Save to .sql file if requested
+        now_iso = datetime.now().isoformat()
         if save_to_file:
             sql_file_path = Path(f"{db_name}.sql")
-            with open(sql_file_path, 'a') as f:
-                f.write(f"\n-- Executed: {datetime.now().isoformat()}\n")
-                f.write(f"{sql_command};\n")
+            _append_sql_log(sql_file_path, f"\n-- Executed: {now_iso}\n{sql_command};\n")
 
         result = {
             "database_name": database_name,
             "mysql_database": db_name,
-            "commands_executed": len(commands),
+            "commands_executed": len(results),
             "results": results,
-            "execution_time": datetime.now().isoformat(),
+            "execution_time": now_iso,
             "sql_saved": save_to_file
         }
 
@@ -188,6 +354,40 @@ def execute_mysql_command(database_name: str, sql_command: str, credentials: Dic
     except Exception as e:
         return {"error": f"Failed to execute MySQL command: {str(e)}"}
 
+# Tables, columns and foreign keys of one schema, each read with the schema name as its only parameter
+_STRUCTURE_QUERIES = (
+    """
+        SELECT TABLE_NAME
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = %s
+        ORDER BY TABLE_NAME
+    """,
+    """
+        SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_KEY
+        FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = %s
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+    """,
+    """
+        SELECT
+            TABLE_NAME,
+            COLUMN_NAME,
+            REFERENCED_TABLE_NAME,
+            REFERENCED_COLUMN_NAME
+        FROM information_schema.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = %s
+        AND REFERENCED_TABLE_NAME IS NOT NULL
+    """,
+)
+
+def _query_rows(connection, query: str, db_name: str) -> list:
+    cursor = connection.cursor()
+    try:
+        cursor.execute(query, (db_name,))
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
 def analyze_mysql_database_structure(database_name: str, credentials: Dict[str, str] = None) -> Dict[str, Any]:
     """
     Analyze MySQL database structure with educational insights
@@ -198,36 +398,35 @@ def analyze_mysql_database_structure(database_name: str, credentials: Dict[str,
         if "error" in credentials:
             return credentials
 
-        db_name = "".join(c for c in database_name if c.isalnum() or c in ('_')).lower()
+        db_name = _sanitize_db_name(database_name)
+        cache_key = _schema_key("structure", credentials, db_name)
+        cached = _cached_schema(cache_key)
+        if cached is not None:
+            return cached
+
+        # connect] to mysql, the three reads are small and run back to back on one connection
+        with _connection(credentials, db_name) as connection:
+            table_rows, column_rows, foreign_key_rows = [
+                _query_rows(connection, query, db_name) for query in _STRUCTURE_QUERIES
+            ]
 
-        # connect] to mysql
-        connection = mysql.connector.connect(database=db_name, **credentials)
-        cursor = connection.cursor()
+        tables = [table[0] for table in table_rows if table[0] != '_database_metadata']
 
-        # Get Tables
-        cursor.execute("SHOW TABLES")
-        tables = [table[0] for table in cursor.fetchall() if table[0] != '_database_metadata']
+        # Whole-schema structure, grouped per table below
+        columns_by_table = defaultdict(list)
+        for table_name, *column in column_rows:
+            columns_by_table[table_name].append(column)
+
+        foreign_keys_by_table = defaultdict(list)
+        for table_name, *foreign_key in foreign_key_rows:
+            foreign_keys_by_table[table_name].append(foreign_key)
 
         table_info = []
         relationships = []
 
         for table_name in tables:
-            # Get table structure
-            cursor.execute(f"DESCRIBE {table_name}")
-            columns = cursor.fetchall()
-
-            # Get foreign key constraints
-            cursor.execute(f"""
-                SELECT 
-                    COLUMN_NAME,
-                    REFERENCED_TABLE_NAME,
-                    REFERENCED_COLUMN_NAME
-                FROM information_schema.KEY_COLUMN_USAGE 
-                WHERE TABLE_SCHEMA = '{db_name}' 
-                AND TABLE_NAME = '{table_name}' 
-                AND REFERENCED_TABLE_NAME IS NOT NULL
-            """)
-            foreign_keys = cursor.fetchall()
+            columns = columns_by_table[table_name]
+            foreign_keys = foreign_keys_by_table[table_name]
 
             # analyse columns
             primary_keys = [col[0] for col in columns if col[3] == 'PRI']
@@ -254,9 +453,6 @@ def analyze_mysql_database_structure(database_name: str, credentials: Dict[str,
                     "relationship_type": "foreign_key"
                 })
 
-        cursor.close()
-        connection.close()
-
         normalization_issues = []
         good_practices = []
 
@@ -301,6 +497,7 @@ def analyze_mysql_database_structure(database_name: str, credentials: Dict[str,
             "analysis_timestamp": datetime.now().isoformat()
         }
 
+        _SCHEMA_CACHE[cache_key] = (time.monotonic(), result)
         return result
 
     except Error as e:
@@ -318,43 +515,60 @@ def list_mysql_databases(credentials: Dict[str, str] = None) -> Dict[str, Any]:
         if "error" in credentials:
             return credentials
 
-        # Connect to MySQL server
-        connection = mysql.connector.connect(**credentials)
-        cursor = connection.cursor()
-
-        # Get all databases
-        cursor.execute("SHOW DATABASES")
-        all_databases = [db[0] for db in cursor.fetchall()]
-
-        # Filter out system databases
-        user_databases = [db for db in all_databases if db not in ['information_schema', 'mysql', 'performance_schema', 'sys']]
+        cache_key = _schema_key("databases", credentials)
+        cached = _cached_schema(cache_key)
+        if cached is not None:
+            return cached
 
-        database_info = []
-        for db_name in user_databases:
-            try:
-                cursor.execute(f"USE {db_name}")
-                cursor.execute("SHOW TABLES")
-                table_count = len(cursor.fetchall())
+        # Connect to MySQL server
+        with _connection(credentials) as connection:
+            cursor = connection.cursor()
 
+            # Table counts and metadata presence for every user database in one query
+            cursor.execute(f"""
+                SELECT
+                    s.SCHEMA_NAME,
+                    COUNT(t.TABLE_NAME),
+                    COALESCE(SUM(t.TABLE_NAME = '_database_metadata'), 0)
+                FROM information_schema.SCHEMATA s
+                LEFT JOIN information_schema.TABLES t ON t.TABLE_SCHEMA = s.SCHEMA_NAME
+                WHERE s.SCHEMA_NAME NOT IN ({", ".join(["%s"] * len(SYSTEM_DATABASES))})
+                GROUP BY s.SCHEMA_NAME
+                ORDER BY s.SCHEMA_NAME
+            """, SYSTEM_DATABASES)
+
+            database_info = []
+            for db_name, table_count, has_metadata in cursor.fetchall():
                 database_info.append({
                     "database_name": db_name,
                     "table_count": table_count,
-                    "has_metadata": False  # Will check if metadata table exists
+                    "has_metadata": bool(has_metadata)
                 })
 
-                # Check for metadata
-                cursor.execute("SHOW TABLES LIKE '_database_metadata'")
-                if cursor.fetchone():
-                    database_info[-1]["has_metadata"] = True
-                    cursor.execute("SELECT metadata_key, metadata_value FROM _database_metadata")
-                    metadata = dict(cursor.fetchall())
-                    database_info[-1]["metadata"] = metadata
-
-            except Error:
-                continue
-
-        cursor.close()
-        connection.close()
+            # Then all metadata rows at once, pivoted back per database
+            with_metadata = [info for info in database_info if info["has_metadata"]]
+            if with_metadata:
+                metadata = defaultdict(dict)
+                try:
+                    cursor.execute(" UNION ALL ".join(
+                        f"SELECT %s, metadata_key, metadata_value FROM {_quote_identifier(info['database_name'])}._database_metadata"
+                        for info in with_metadata
+                    ), tuple(info["database_name"] for info in with_metadata))
+                    for db_name, key, value in cursor.fetchall():
+                        metadata[db_name][key] = value
+                except Error:
+                    # one unreadable table shouldn't hide the others, read them one by one
+                    for info in with_metadata:
+                        try:
+                            cursor.execute(f"SELECT metadata_key, metadata_value FROM {_quote_identifier(info['database_name'])}._database_metadata")
+                            metadata[info["database_name"]] = dict(cursor.fetchall())
+                        except Error:
+                            continue
+                for info in with_metadata:
+                    if info["database_name"] in metadata:
+                        info["metadata"] = metadata[info["database_name"]]
+
+            cursor.close()
 
         result = {
             "total_databases": len(database_info),
@@ -363,6 +577,7 @@ def list_mysql_databases(credentials: Dict[str, str] = None) -> Dict[str, Any]:
             "scan_timestamp": datetime.now().isoformat()
         }
 
+        _SCHEMA_CACHE[cache_key] = (time.monotonic(), result)
         return result
 
     except Error as e:
@@ -1,56 +1,136 @@
 
+import ast
+import atexit
+import base64
 import os
 import platform
+import re
+import shlex
+import shutil
 import subprocess
+import threading
 import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# cpu_percent(None) reports usage since the previous call, primed here so the first one isn't 0.0
+CPU_MIN_INTERVAL = 0.05
+_cpu_sampled_at = time.monotonic()
+if psutil is not None:
+    psutil.cpu_percent(interval=None)
 
 IS_WINDOWS = platform.system() == "Windows"
 IS_MACOS = platform.system() == "Darwin"
 IS_LINUX = platform.system() == "Linux"
 
+# Doesn't change while the process runs, processor() even shells out / reads /proc on some systems
+_STATIC_SYSINFO = {
+    "platform": platform.system(),
+    "platform_version": platform.version(),
+    "architecture": platform.architecture()[0],
+    "processor": platform.processor(),
+    "hostname": platform.node(),
+    "python_version": platform.python_version(),
+    "home_directory": str(Path.home()),
+}
+
+# print calls outside comment lines, bare pass lines and TODO/FIXME markers, found in one pass
+# over the source. print matches empty at the start of its line, so a TODO later on it is still seen.
+_ISSUE_SCAN = re.compile(
+    r"(?P<print>^(?![ \t]*#)(?=[^\n]*print\())|(?P<pass>^[ \t]*pass[ \t]*\r?$)|(?P<todo>(?i:todo|fixme))",
+    re.MULTILINE
+)
+_ISSUE_SCAN_BYTES = re.compile(_ISSUE_SCAN.pattern.encode(), re.MULTILINE)
+
+# Pipes, redirects, chaining and variables on Windows still need PowerShell to run
+_POWERSHELL_SYNTAX = re.compile(r"[|&;<>()$`{}%]")
+
+# stdout/stderr of a single command are cut off past this many bytes
+MAX_OUT = 1 << 20
+
+# analyze_python_code refuses what read_file_content refuses: over 1MB or a known binary type
+MAX_ANALYZE_BYTES = 1024 * 1024
+BINARY_SUFFIXES = ('.jpg', '.png', '.pdf', '.zip')
+# only parses of files up to this size are kept in the lru_cache
+PARSE_CACHE_MAX_BYTES = 64 * 1024
+
+# Interpreter for run_python_script(s), linux And Mac use python3
+PYTHON_CMD = "python" if IS_WINDOWS else "python3"
+
+# Marks the end of each command's output when several run in one process
+BATCH_SEPARATOR = "__AICOOK_BATCH_END__"
+
+# Runs several scripts inside one interpreter, printing the separator + exit code after each
+_PYTHON_BATCH_DRIVER = """
+import os, runpy, sys, traceback
+sep, paths = sys.argv[1], sys.argv[2:]
+for path in paths:
+    code = 0
+    try:
+        os.chdir(os.path.dirname(path))
+        # what the script would see run on its own
+        sys.argv = [path]
+        runpy.run_path(path, run_name="__main__")
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    sys.stdout.flush()
+    print("\\n" + sep + str(code), flush=True)
+    print("\\n" + sep, file=sys.stderr, flush=True)
+"""
+
+def _cpu_percent() -> float:
+    """Usage since the last sample, only waits when that was too recent to mean anything."""
+    global _cpu_sampled_at
+    elapsed = time.monotonic() - _cpu_sampled_at
+    percent = psutil.cpu_percent(interval=None if elapsed >= CPU_MIN_INTERVAL else CPU_MIN_INTERVAL)
+    _cpu_sampled_at = time.monotonic()
+    return percent
+
 def get_system_info() -> Dict[str, Any]:
     """
     Get current system information
     """
     try:
-        import psutil
-
-        # Get basic system info Use global platform, to avoid repeating yourself and checking everywhere...
+        # Get basic system info, the fixed parts were read once at import
         system_info = {
-            "platform": platform.system(),
-            "platform_version": platform.version(),
-            "architecture": platform.architecture()[0],
-            "processor": platform.processor(),
-            "hostname": platform.node(),
-            "python_version": platform.python_version(),
+            **_STATIC_SYSINFO,
             "current_user": os.getenv("USERNAME") if IS_WINDOWS else os.getenv("USER"),
             "current_directory": str(Path.cwd()),
-            "home_directory": str(Path.home()),
             "timestamp": datetime.now().isoformat()
         }
 
         # Get system resources if psutil available...
-        try:
+        if psutil is None:
+            system_info["note"] = "Install psutil for detailed system metrics"
+        else:
             # Use C:\ for Windows and / for MacOS and linux
             disk_path = "C:\\" if IS_WINDOWS else "/"
+            # one call each, every field below reads from these
+            memory = psutil.virtual_memory()
+            disk = psutil.disk_usage(disk_path)
 
             system_info.update({
-                "cpu_percent": psutil.cpu_percent(interval=1),
-                "memory_total": psutil.virtual_memory().total,
-                "memory_available": psutil.virtual_memory().available,
-                "memory_percent": psutil.virtual_memory().percent,
+                "cpu_percent": _cpu_percent(),
+                "memory_total": memory.total,
+                "memory_available": memory.available,
+                "memory_percent": memory.percent,
                 "disk_usage": {
-                    "total": psutil.disk_usage(disk_path).total,
-                    "used": psutil.disk_usage(disk_path).used,
-                    "free": psutil.disk_usage(disk_path).free,
-                    "percent": (psutil.disk_usage(disk_path).used / psutil.disk_usage(disk_path).total) * 100
+                    "total": disk.total,
+                    "used": disk.used,
+                    "free": disk.free,
+                    "percent": (disk.used / disk.total) * 100
                 }
             })
-        except ImportError:
-            system_info["note"] = "Install psutil for detailed system metrics"
 
         return system_info
 
@@ -70,12 +150,11 @@ def run_python_script(script_path: str, timeout: int = 30) -> Dict[str, Any]:
         start_time = time.time()
 
         # Use platform-specific Python command(linux And Mac use python3...)
-        python_cmd = "python" if IS_WINDOWS else "python3"
+        python_cmd = PYTHON_CMD
 
         result = subprocess.run(
             [python_cmd, str(path)],
             capture_output=True,
-            text=True,
             timeout=timeout,
             cwd=path.parent
         )
@@ -87,8 +166,9 @@ def run_python_script(script_path: str, timeout: int = 30) -> Dict[str, Any]:
             "platform": platform.system(),
             "python_command": python_cmd,
             "exit_code": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
+            "stdout": _decode_output(result.stdout),
+            "stderr": _decode_output(result.stderr),
+            "truncated": len(result.stdout) > MAX_OUT or len(result.stderr) > MAX_OUT,
             "execution_time": round(execution_time, 2),
             "success": result.returncode == 0,
             "timestamp": datetime.now().isoformat()
@@ -102,19 +182,56 @@ def run_python_script(script_path: str, timeout: int = 30) -> Dict[str, Any]:
         return {"error": f"Failed to execute script: {str(e)}"}
 
 
+def _source_lines(content: bytes, line_numbers: List[int]) -> List[str]:
+    """Stripped text of the given (sorted) 1-based lines, without splitting the whole file."""
+    lines = []
+    line_num = 1
+    line_start = 0
+    for wanted in line_numbers:
+        while line_num < wanted:
+            line_start = content.find(b'\n', line_start) + 1
+            line_num += 1
+        line_end = content.find(b'\n', line_start)
+        lines.append(content[line_start:line_end if line_end >= 0 else len(content)].decode('utf-8', errors='replace').strip())
+    return lines
+
+
+@lru_cache(maxsize=32)
+def _parse_cached(content: bytes, file_path: str) -> ast.AST:
+    return ast.parse(content, file_path)
+
+
+def _parse(content: bytes, file_path: str) -> ast.AST:
+    """ast.parse, cached for small files so re-analyzing an unchanged one skips the parse."""
+    if len(content) > PARSE_CACHE_MAX_BYTES:
+        return ast.parse(content, file_path)
+    return _parse_cached(content, file_path)
+
+
 def analyze_python_code(file_path: str) -> Dict[str, Any]:
     """
     Analyze Python code for potential issues using basic checks
     """
     try:
-        from .file_system import read_file_content
-        # First Read The file
-        file_content = read_file_content(file_path)
-        if "error" in file_content:
-            return file_content
-
-        content = file_content["content"]
-        lines = content.split('\n')
+        # First Read The file, as bytes: the scan, the line numbers and ast.parse all work on them
+        path = Path(file_path).expanduser()
+        if not path.is_file():
+            from .file_system import read_file_content
+            return read_file_content(file_path)
+
+        # same limits as read_file_content
+        file_size = path.stat().st_size
+        if file_size > MAX_ANALYZE_BYTES:
+            return {"error": f"File too large: {file_size} bytes (max 1MB)"}
+        suffix = path.suffix.lower()
+        if suffix in BINARY_SUFFIXES:
+            return {"error": f"Binary file type not supported: {suffix}"}
+
+        content = path.read_bytes()
+        try:
+            content.decode('utf-8')
+        except UnicodeDecodeError:
+            return {"error": f"Cannot decode file as UTF-8: {file_path}"}
 
         issues = []
         suggestions = []
@@ -122,40 +239,65 @@ def analyze_python_code(file_path: str) -> Dict[str, Any]:
         functions = []
         classes = []
 
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-            if stripped.startswith('import ') or stripped.startswith('from '):
-                imports.append(stripped)
-
-            if stripped.startswith('def '):
-                functions.append(stripped)
-
-            if stripped.startswith('class '):
-                classes.append(stripped)
-
-            # issue detection
-            if 'print(' in line and not line.strip().startswith('#'):
-                suggestions.append(f"Line {i}: Consider using logging instead of print statements")
-
-            if line.strip() == 'pass' and i > 1:
-                issues.append(f"Line {i}: Empty pass statement - might need implementation")
-
-            if 'TODO' in line.upper() or 'FIXME' in line.upper():
-                issues.append(f"Line {i}: TODO/FIXME comment found")
-
-        # try basic syntax check
+        # issue detection
+        line_num = 1
+        counted_to = 0
+        seen = set()
+        for match in _ISSUE_SCAN_BYTES.finditer(content):
+            start = match.start()
+            line_num += content.count(b'\n', counted_to, start)
+            counted_to = start
+            kind = match.lastgroup
+            if (line_num, kind) in seen:
+                continue
+            seen.add((line_num, kind))
+
+            if kind == "print":
+                suggestions.append(f"Line {line_num}: Consider using logging instead of print statements")
+            elif kind == "pass":
+                if line_num > 1:
+                    issues.append(f"Line {line_num}: Empty pass statement - might need implementation")
+            else:
+                issues.append(f"Line {line_num}: TODO/FIXME comment found")
+
+        # one parse gives the syntax check and the structure
         syntax_valid = True
         syntax_error = None
         try:
-            compile(content, file_path, 'exec')
+            tree = _parse(content, file_path)
         except SyntaxError as e:
+            tree = None
             syntax_valid = False
             syntax_error = f"Line {e.lineno}: {e.msg}"
             issues.append(f"Syntax Error: {syntax_error}")
 
+        if tree is not None:
+            found = []
+            for node in ast.walk(tree):
+                if isinstance(node, (ast.Import, ast.ImportFrom)):
+                    found.append((node.lineno, imports))
+                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    found.append((node.lineno, functions))
+                elif isinstance(node, ast.ClassDef):
+                    found.append((node.lineno, classes))
+            # ast.walk is breadth-first, report them in source order like before
+            found.sort(key=lambda item: item[0])
+            for (_, target), line in zip(found, _source_lines(content, [lineno for lineno, _ in found])):
+                target.append(line)
+        else:
+            # can't parse, fall back to matching line prefixes
+            for line in content.splitlines():
+                stripped = line.decode('utf-8', errors='replace').strip()
+                if stripped.startswith('import ') or stripped.startswith('from '):
+                    imports.append(stripped)
+                if stripped.startswith('def '):
+                    functions.append(stripped)
+                if stripped.startswith('class '):
+                    classes.append(stripped)
+
         analysis = {
             "file_path": file_path,
-            "total_lines": len(lines),
+            "total_lines": content.count(b'\n') + 1,
             "imports_count": len(imports),
             "functions_count": len(functions),
             "classes_count": len(classes),
@@ -175,6 +317,68 @@ def analyze_python_code(file_path: str) -> Dict[str, Any]:
         return {"error": f"Failed to analyze code: {str(e)}"}
 
 
+# Long-lived PowerShell that shows the Windows notifications, startup alone costs hundreds of ms
+_NOTIFIER: Optional[subprocess.Popen] = None
+_notifier_lock = threading.Lock()
+NOTIFY_DONE = "__AICOOK_NOTIFY_DONE__"
+
+# One line per notification, `-Command -` runs stdin line by line. The previous icon is disposed
+# on the next call instead of sleeping 3s here, the balloon needs it alive while it's shown.
+_WINDOWS_NOTIFY = (
+    "try {{ "
+    "Add-Type -AssemblyName System.Windows.Forms; "
+    "if ($global:aicookNote) {{ $global:aicookNote.Dispose() }}; "
+    "$n = New-Object System.Windows.Forms.NotifyIcon; "
+    "$n.Icon = [System.Drawing.SystemIcons]::Information; "
+    "$n.BalloonTipTitle = [Text.Encoding]::UTF8.GetString([Convert]::FromBase64String('{title}')); "
+    "$n.BalloonTipText = [Text.Encoding]::UTF8.GetString([Convert]::FromBase64String('{message}')); "
+    "$n.Visible = $true; "
+    "$n.ShowBalloonTip(3000); "
+    "$global:aicookNote = $n; "
+    "Write-Output '{done}0' "
+    "}} catch {{ Write-Output ('{done}1 ' + $_.Exception.Message) }}\n"
+)
+
+
+def _stop_notifier() -> None:
+    if _NOTIFIER is not None and _NOTIFIER.poll() is None:
+        _NOTIFIER.stdin.close()
+        try:
+            _NOTIFIER.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            _NOTIFIER.kill()
+
+
+atexit.register(_stop_notifier)
+
+
+def _b64(text: str) -> str:
+    # passed to PowerShell as base64 so quotes and newlines in the text can't break the line
+    return base64.b64encode(text.encode("utf-8")).decode("ascii")
+
+
+def _notify_windows(message: str, title: str) -> Tuple[bool, Optional[str]]:
+    """Shows a balloon tip through the shared PowerShell, started on first use and restarted if it died."""
+    global _NOTIFIER
+    with _notifier_lock:
+        if _NOTIFIER is None or _NOTIFIER.poll() is not None:
+            _NOTIFIER = subprocess.Popen(
+                ["powershell", "-NoLogo", "-NoProfile", "-NoExit", "-Command", "-"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+        _NOTIFIER.stdin.write(_WINDOWS_NOTIFY.format(title=_b64(title), message=_b64(message), done=NOTIFY_DONE))
+        _NOTIFIER.stdin.flush()
+        for line in _NOTIFIER.stdout:
+            if line.startswith(NOTIFY_DONE):
+                status = line[len(NOTIFY_DONE):].strip()
+                return status == "0", status[2:] or None
+        return False, "Notification process exited"
+
+
 def send_system_notification(message: str, title: str = "System Agent") -> Dict[str, Any]:
     """
     Send system notification cross-platform
@@ -189,23 +393,16 @@ def send_system_notification(message: str, title: str = "System Agent") -> Dict[
                 text=True
             )
         elif IS_WINDOWS:
-            # Use PowerShell for Windows notifications
-            script = f'''
-            Add-Type -AssemblyName System.Windows.Forms
-            $notification = New-Object System.Windows.Forms.NotifyIcon
-            $notification.Icon = [System.Drawing.SystemIcons]::Information
-            $notification.BalloonTipTitle = "{title}"
-            $notification.BalloonTipText = "{message}"
-            $notification.Visible = $true
-            $notification.ShowBalloonTip(3000)
-            Start-Sleep -Seconds 3
-            $notification.Dispose()
-            '''
-            result = subprocess.run(
-                ["powershell", "-Command", script],
-                capture_output=True,
-                text=True
-            )
+            # Use PowerShell for Windows notifications, one session serves every call
+            success, error = _notify_windows(message, title)
+            return {
+                "message": message,
+                "title": title,
+                "platform": platform.system(),
+                "success": success,
+                "error": error,
+                "timestamp": datetime.now().isoformat()
+            }
         elif IS_LINUX:
             # use notify-send for linux
             result = subprocess.run(
@@ -231,6 +428,25 @@ def send_system_notification(message: str, title: str = "System Agent") -> Dict[
         return {"error": f"Failed to send notification: {str(e)}"}
 
 
+def _decode_output(data: bytes) -> str:
+    return data[:MAX_OUT].decode("utf-8", errors="replace").strip()
+
+
+def _windows_argv(command: str) -> Optional[List[str]]:
+    """argv for a command that's just an executable plus arguments, None if it needs PowerShell."""
+    if _POWERSHELL_SYNTAX.search(command):
+        return None
+    try:
+        argv = shlex.split(command, posix=False)
+    except ValueError:
+        return None
+    # non-posix mode keeps the quotes, subprocess adds its own
+    argv = [arg[1:-1] if len(arg) > 1 and arg[0] == arg[-1] and arg[0] in "\"'" else arg for arg in argv]
+    if not argv or shutil.which(argv[0]) is None:
+        return None  # cmdlets, aliases and cmd builtins like dir
+    return argv
+
+
 def execute_cli_command(command: str, timeout: int = 30) -> Dict[str, Any]:
     """
     Execute CLI command with proper shell handling
@@ -238,16 +454,16 @@ def execute_cli_command(command: str, timeout: int = 30) -> Dict[str, Any]:
     try:
         start_time = time.time()
         if IS_WINDOWS:
-            # For win-os, use powershell
-            command_list = ["powershell", "-Command", command]
+            # a plain program call is started directly, skipping PowerShell's startup
+            command_list = _windows_argv(command) or ["powershell", "-Command", command]
         else:
-            # for unix split the command into a list
-            command_list = command.split()
-            
+            # for unix split the command into a list, quoted arguments stay whole
+            command_list = shlex.split(command)
+
+        # raw bytes, only the part that's returned gets decoded
         result = subprocess.run(
             command_list,
             capture_output=True,
-            text=True,
             timeout=timeout,
             cwd=Path.cwd(),
             shell=False 
@@ -259,8 +475,9 @@ def execute_cli_command(command: str, timeout: int = 30) -> Dict[str, Any]:
             "command": command,
             "platform": platform.system(),
             "exit_code": result.returncode,
-            "stdout": result.stdout.strip(),
-            "stderr": result.stderr.strip(),
+            "stdout": _decode_output(result.stdout),
+            "stderr": _decode_output(result.stderr),
+            "truncated": len(result.stdout) > MAX_OUT or len(result.stderr) > MAX_OUT,
             "execution_time": round(execution_time, 2),
             "success": result.returncode == 0,
             "working_directory": str(Path.cwd()),
@@ -273,3 +490,170 @@ def execute_cli_command(command: str, timeout: int = 30) -> Dict[str, Any]:
         return {"error": f"Command execution timed out after {timeout} seconds"}
     except Exception as e:
         return {"error": f"Failed to execute command: {str(e)}"}
+
+
+def _split_batch_output(stdout: bytes, stderr: bytes, count: int) -> List[Dict[str, Any]]:
+    """
+    Splits the combined output of a batched run back into one entry per item, each capped at MAX_OUT.
+    Items after one that killed the process (e.g. `exit`) come back as not run.
+    """
+    separator = re.escape(BATCH_SEPARATOR.encode())
+    pieces = re.split(rb"\n?" + separator + rb"(-?\d+)\r?\n?", stdout)
+    err_pieces = re.split(rb"\n?" + separator + rb"\r?\n?", stderr)
+    outputs = []
+    for i in range(count):
+        if 2 * i + 1 >= len(pieces):
+            outputs.append(None)
+            continue
+        out = pieces[2 * i]
+        err = err_pieces[i] if i < len(err_pieces) else b""
+        outputs.append({
+            "stdout": _decode_output(out),
+            "stderr": _decode_output(err),
+            "truncated": len(out) > MAX_OUT or len(err) > MAX_OUT,
+            "exit_code": int(pieces[2 * i + 1]),
+        })
+    return outputs
+
+
+def _batch_line(command: str) -> str:
+    """
+    One batched command, run the way execute_cli_command would run it on its own:
+    no expansion, globbing, pipes or builtins like cd. Raises ValueError on unbalanced quotes.
+    """
+    if IS_WINDOWS:
+        argv = _windows_argv(command)
+        if argv is None:
+            return command  # the single command goes through PowerShell as written too
+        return "& " + " ".join("'" + arg.replace("'", "''") + "'" for arg in argv)
+    argv = shlex.split(command)
+    if not argv:
+        raise ValueError("empty command")
+    # exec only finds programs on PATH, like subprocess does, and the subshell keeps cd etc. from leaking
+    return f"(exec -- {shlex.join(argv)})"
+
+
+def execute_cli_commands(commands: List[str], timeout: int = 30) -> List[Dict[str, Any]]:
+    """
+    Execute several CLI commands in a single shell process (one fork+exec instead of N).
+    Returns one result per command, in order, shaped like execute_cli_command's.
+    """
+    try:
+        results = [None] * len(commands)
+        runnable = []
+        for i, command in enumerate(commands):
+            try:
+                runnable.append((i, _batch_line(command)))
+            except ValueError as e:
+                # only this command is rejected, the rest of the batch still runs
+                results[i] = {"command": command, "error": f"Failed to execute command: {str(e)}"}
+
+        start_time = time.time()
+        if IS_WINDOWS:
+            # native programs set $LASTEXITCODE, cmdlets only $?, so reset it and fall back to $?
+            script = "".join(
+                f'$LASTEXITCODE = $null\n{line}\n$ok = $?; '
+                f'if ($LASTEXITCODE -ne $null) {{ $code = $LASTEXITCODE }} else {{ $code = [int](-not $ok) }}\n'
+                f'Write-Output "`n{BATCH_SEPARATOR}$code"; [Console]::Error.WriteLine("`n{BATCH_SEPARATOR}")\n'
+                for _, line in runnable
+            )
+            command_list = ["powershell", "-Command", script]
+        else:
+            script = "".join(
+                f"{line}\nprintf '\\n{BATCH_SEPARATOR}%d\\n' $?; printf '\\n{BATCH_SEPARATOR}\\n' >&2\n"
+                for _, line in runnable
+            )
+            command_list = ["bash", "-c", script]
+
+        if runnable:
+            # raw bytes, each command's part is capped and decoded on its own
+            result = subprocess.run(
+                command_list,
+                capture_output=True,
+                timeout=timeout,
+                cwd=Path.cwd(),
+                shell=False
+            )
+            outputs = _split_batch_output(result.stdout, result.stderr, len(runnable))
+        else:
+            outputs = []
+
+        execution_time = round(time.time() - start_time, 2)
+        # the same for every command in the batch
+        system_name = platform.system()
+        working_directory = str(Path.cwd())
+        now_iso = datetime.now().isoformat()
+        for (i, _), output in zip(runnable, outputs):
+            command = commands[i]
+            if output is None:
+                results[i] = {"command": command, "error": "Command was not run, an earlier command in the batch ended the shell"}
+                continue
+            results[i] = {
+                "command": command,
+                "platform": system_name,
+                "exit_code": output["exit_code"],
+                "stdout": output["stdout"],
+                "stderr": output["stderr"],
+                "truncated": output["truncated"],
+                "execution_time": execution_time,
+                "batched": True,
+                "success": output["exit_code"] == 0,
+                "working_directory": working_directory,
+                "timestamp": now_iso
+            }
+        return results
+
+    except subprocess.TimeoutExpired:
+        return [{"error": f"Batched command execution timed out after {timeout} seconds"} for _ in commands]
+    except Exception as e:
+        return [{"error": f"Failed to execute command: {str(e)}"} for _ in commands]
+
+
+def run_python_scripts(script_paths: List[str], timeout: int = 30) -> List[Dict[str, Any]]:
+    """
+    Run several Python scripts in one interpreter, paying the startup cost once.
+    Scripts share the process (imported modules, globals set on sys), results come back in order.
+    """
+    try:
+        paths = [Path(p).expanduser().resolve() for p in script_paths]
+        existing = [p for p in paths if p.exists()]
+        results = {}
+
+        if existing:
+            start_time = time.time()
+            result = subprocess.run(
+                [PYTHON_CMD, "-c", _PYTHON_BATCH_DRIVER, BATCH_SEPARATOR, *map(str, existing)],
+                capture_output=True,
+                timeout=timeout
+            )
+            execution_time = round(time.time() - start_time, 2)
+            system_name = platform.system()
+            now_iso = datetime.now().isoformat()
+
+            for path, output in zip(existing, _split_batch_output(result.stdout, result.stderr, len(existing))):
+                if output is None:
+                    results[path] = {"error": f"Script was not run, an earlier script in the batch ended the interpreter: {path}"}
+                    continue
+                results[path] = {
+                    "script_path": str(path),
+                    "platform": system_name,
+                    "python_command": PYTHON_CMD,
+                    "exit_code": output["exit_code"],
+                    "stdout": output["stdout"],
+                    "stderr": output["stderr"],
+                    "truncated": output["truncated"],
+                    "execution_time": execution_time,
+                    "batched": True,
+                    "success": output["exit_code"] == 0,
+                    "timestamp": now_iso
+                }
+
+        return [
+            results.get(path, {"error": f"Script not found: {script_path}"})
+            for script_path, path in zip(script_paths, paths)
+        ]
+
+    except subprocess.TimeoutExpired:
+        return [{"error": f"Batched script execution timed out after {timeout} seconds"} for _ in script_paths]
+    except Exception as e:
+        return [{"error": f"Failed to execute script: {str(e)}"} for _ in script_paths]
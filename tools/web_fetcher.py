@@ -1,24 +1,124 @@
 
+import asyncio
+import atexit
+import importlib.util
+
+import httpx
 import requests
-from typing import Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, List
+from urllib3.util.retry import Retry
+
+# Pages are read up to this many bytes, anything past it is cut off
+MAX_BYTES = 4 << 20
+CHUNK_SIZE = 65536
+
+
+def _make_session() -> requests.Session:
+    """Shared keep-alive session for callers that don't bring their own."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=2, backoff_factor=0.2))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # urllib3 only decodes brotli when a brotli package is installed
+    has_brotli = any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi"))
+    session.headers["Accept-Encoding"] = "gzip, deflate, br" if has_brotli else "gzip, deflate"
+    atexit.register(session.close)
+    return session
+
+
+_SESSION = _make_session()
+
+
+def _page(url: str, body: bytes, encoding: str, status_code: int, truncated: bool) -> Dict[str, Any]:
+    return {
+        "url": url,
+        "content": body.decode(encoding or "utf-8", errors="replace"),
+        "status_code": status_code,
+        "truncated": truncated
+    }
 
-def fetch_url_content(url: str) -> Dict[str, Any]:
+
+def fetch_url_content(url: str, session: requests.Session = None) -> Dict[str, Any]:
     """
     Fetches and returns the text content of a given URL.
+    Pass a long-lived `session` to reuse its keep-alive connections.
     """
+    response = None
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()  
+        # streamed, so non-text and oversized bodies are never read in full
+        response = (session or _SESSION).get(url, timeout=10, stream=True)
+        response.raise_for_status()
 
         # we will just focus on text content for now
         content_type = response.headers.get("content-type", "")
         if "text" not in content_type:
             return {"error": f"URL does not point to a text-based document (content-type: {content_type})"}
 
-        return {
-            "url": url,
-            "content": response.text,
-            "status_code": response.status_code
-        }
+        body = bytearray()
+        truncated = False
+        for chunk in response.iter_content(CHUNK_SIZE):
+            body.extend(chunk)
+            if len(body) > MAX_BYTES:
+                truncated = True
+                break
+
+        return _page(url, bytes(body[:MAX_BYTES]), response.encoding, response.status_code, truncated)
     except requests.exceptions.RequestException as e:
         return {"error": f"Failed to fetch URL: {str(e)}"}
+    finally:
+        if response is not None:
+            response.close()
+
+
+async def fetch_url_content_async(url: str, client: httpx.AsyncClient = None) -> Dict[str, Any]:
+    """
+    Async version of fetch_url_content, reuses `client` (and its open connections) when given.
+    """
+    if client is None:
+        async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
+            return await fetch_url_content_async(url, client)
+
+    try:
+        async with client.stream("GET", url, timeout=10) as response:
+            response.raise_for_status()
+
+            content_type = response.headers.get("content-type", "")
+            if "text" not in content_type:
+                return {"error": f"URL does not point to a text-based document (content-type: {content_type})"}
+
+            body = bytearray()
+            truncated = False
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                body.extend(chunk)
+                if len(body) > MAX_BYTES:
+                    truncated = True
+                    break
+
+            return _page(url, bytes(body[:MAX_BYTES]), response.encoding, response.status_code, truncated)
+    except httpx.HTTPError as e:
+        return {"error": f"Failed to fetch URL: {str(e)}"}
+
+
+async def fetch_urls_content_async(urls: List[str], client: httpx.AsyncClient = None) -> List[Dict[str, Any]]:
+    """
+    Fetches all `urls` concurrently over one client, results come back in the same order.
+    """
+    if client is None:
+        async with httpx.AsyncClient(timeout=10, follow_redirects=True) as client:
+            return await fetch_urls_content_async(urls, client)
+
+    pages = await asyncio.gather(*(fetch_url_content_async(url, client) for url in urls), return_exceptions=True)
+    # one bad URL (e.g. httpx.InvalidURL, not an HTTPError) shouldn't fail the rest
+    return [
+        {"error": f"Failed to fetch URL: {str(page)}"} if isinstance(page, Exception) else page
+        for page in pages
+    ]
+
+
+def fetch_urls_content(urls: List[str]) -> List[Dict[str, Any]]:
+    """
+    Batch version of fetch_url_content for sync callers, takes about as long as the slowest URL.
+    Can't be called from inside a running event loop, await fetch_urls_content_async there.
+    """
+    return asyncio.run(fetch_urls_content_async(urls))